@@ -15,9 +15,6 @@ from src.gui.dialog_modules import ClickModuleDialog, SwipeModuleDialog, TimeSle
 from src.gui.modules.image_search_module_improved import ImageSearchModuleDialog
 from src.gui.custom_widgets import ActivityModuleDialog, ModuleListItem
 from src.utils.resources import Resources
-from src.utils.style_constants import (
-    CREATE_BOT_STYLE
-)
 from src.utils.ui_factory import (
     create_title_label, create_dark_button,
     create_input_field, create_frame, create_table
@@ -118,8 +115,7 @@ class CreateBotPage(QWidget):
 
     def setup_ui(self):
         """Настраивает интерфейс страницы создания бота"""
-        # Применяем стиль к странице
-        self.setStyleSheet(CREATE_BOT_STYLE)
+        # Стиль страницы (QWidget#createBotPage) задается глобально в APPLICATION_STYLESHEET
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -240,7 +236,6 @@ class CreateBotPage(QWidget):
 
         # Таблица модулей (холст)
         self.modules_table = create_table(["№", "Тип модуля", "Описание", "Действия"])
-        self.modules_table.verticalHeader().setVisible(False)
         self.modules_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.modules_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         self.modules_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
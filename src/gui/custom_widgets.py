@@ -12,7 +12,7 @@ from typing import Dict, List, Any, Optional
 
 from src.utils.style_constants import (
     MODULE_ITEM_STYLE, TOOL_BUTTON_STYLE, ACTIVITY_CANVAS_STYLE,
-    ACTIVITY_DIALOG_STYLE, ACTIVITY_MODULE_TITLE_STYLE, MODULE_BUTTON_STYLE,
+    ACTIVITY_DIALOG_STYLE, ACTIVITY_MODULE_TITLE_STYLE,
     HEADER_LAYOUT_STYLE, MODULE_FRAME_STYLE, MODULE_NUMBER_STYLE, MODULE_TYPE_STYLE,
     MODULE_DESC_STYLE, BUTTON_CONTAINER_STYLE
 )
@@ -300,8 +300,8 @@ class ActivityCanvasModule(CanvasModule):
 
         # Buttons
         buttons_layout = QHBoxLayout()
-        cancel_btn = create_button("Отмена", MODULE_BUTTON_STYLE)
-        ok_btn = create_button("ОК", MODULE_BUTTON_STYLE)
+        cancel_btn = create_button("Отмена", style_class="accent")
+        ok_btn = create_button("ОК", style_class="accent")
 
         cancel_btn.clicked.connect(dialog.reject)
         ok_btn.clicked.connect(dialog.accept)
@@ -341,8 +341,8 @@ class ActivityCanvasModule(CanvasModule):
 
         # Buttons
         buttons_layout = QHBoxLayout()
-        cancel_btn = create_button("Отмена", MODULE_BUTTON_STYLE)
-        ok_btn = create_button("ОК", MODULE_BUTTON_STYLE)
+        cancel_btn = create_button("Отмена", style_class="accent")
+        ok_btn = create_button("ОК", style_class="accent")
 
         cancel_btn.clicked.connect(dialog.reject)
         ok_btn.clicked.connect(dialog.accept)
@@ -530,8 +530,8 @@ class ActivityModuleDialog(QDialog):
 
         # Кнопки
         buttons_layout = QHBoxLayout()
-        self.btn_cancel = create_button("Отмена", MODULE_BUTTON_STYLE)
-        self.btn_confirm = create_button("Подтвердить", MODULE_BUTTON_STYLE)
+        self.btn_cancel = create_button("Отмена", style_class="accent")
+        self.btn_confirm = create_button("Подтвердить", style_class="accent")
 
         self.btn_cancel.clicked.connect(self.reject)
         self.btn_confirm.clicked.connect(self.accept)
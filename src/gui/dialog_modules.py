@@ -12,7 +12,7 @@ from PyQt6.QtCore import Qt
 from typing import Dict, Any, Optional
 
 from src.utils.style_constants import (
-    MODULE_DIALOG_STYLE, MODULE_BUTTON_STYLE, FORM_GROUP_STYLE,
+    MODULE_DIALOG_STYLE, FORM_GROUP_STYLE,
     BUTTON_PANEL_STYLE, DIALOG_TITLE_STYLE
 )
 from src.utils.ui_factory import (
@@ -57,9 +57,9 @@ class BaseModuleDialog(QDialog):
         """Добавляет стандартные кнопки Отмена/Подтвердить"""
         buttons_layout = QHBoxLayout()
 
-        # Создаем кнопки напрямую с правильным стилем
-        self.btn_cancel = create_button("Отмена", MODULE_BUTTON_STYLE)
-        self.btn_confirm = create_button("Подтвердить", MODULE_BUTTON_STYLE)
+        # Оформление кнопок задается вариантом из листа стилей диалога
+        self.btn_cancel = create_button("Отмена", style_class="accent")
+        self.btn_confirm = create_button("Подтвердить", style_class="accent")
 
         self.btn_cancel.clicked.connect(self.reject)
         self.btn_confirm.clicked.connect(self.accept)
@@ -13,12 +13,12 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QDateTime
 
 from src.utils.style_constants import (
-    COLOR_PRIMARY, COLOR_BG_DARK_3, COLOR_TEXT, BASE_BUTTON_STYLE, BASE_DIALOG_STYLE,
-    SETTINGS_CHECKBOX_STYLE, SCHEDULE_CONTAINER_STYLE, DATETIME_EDIT_STYLE,
-    SETTINGS_FORM_STYLE, SETTINGS_GROUP_STYLE, SETTINGS_SEPARATOR_STYLE
+    COLOR_PRIMARY, COLOR_BG_DARK_3, COLOR_TEXT,
+    SCHEDULE_CONTAINER_STYLE, DATETIME_EDIT_STYLE,
+    SETTINGS_FORM_STYLE, SETTINGS_SEPARATOR_STYLE
 )
 from src.utils.ui_factory import (
-    create_input_field, create_spinbox_without_buttons,
+    apply_style, create_input_field, create_spinbox_without_buttons,
     create_button, create_group_box, create_label, create_text_label
 )
 
@@ -35,12 +35,10 @@ class BotSettingsDialog(QDialog):
         self.setWindowTitle("Настройка параметров бота")
         self.setModal(True)
         self.resize(450, 400)
-        self.setStyleSheet(BASE_DIALOG_STYLE)
+        # Группы и чекбокс лежат прямо в диалоге, поэтому их стили задаются одним листом
+        apply_style(self, "BASE_DIALOG_STYLE", "SETTINGS_GROUP_STYLE", "SETTINGS_CHECKBOX_STYLE")
         self.setup_ui()
 
-        # Устанавливаем начальный стиль для чекбокса
-        self.enable_schedule.setStyleSheet(SETTINGS_CHECKBOX_STYLE)
-
     def setup_ui(self):
         """Настраивает интерфейс диалога"""
         layout = QVBoxLayout(self)
@@ -59,7 +57,6 @@ class BotSettingsDialog(QDialog):
 
         # Группа планирования запуска с улучшенным стилем
         schedule_group = create_group_box("Планирование запуска")
-        schedule_group.setStyleSheet(SETTINGS_GROUP_STYLE)
         schedule_layout = QVBoxLayout(schedule_group)
 
         # Добавляем небольшую верхнюю прокладку для чекбокса
@@ -103,7 +100,6 @@ class BotSettingsDialog(QDialog):
 
         # Группа выполнения
         execution_group = create_group_box("Параметры выполнения")
-        execution_group.setStyleSheet(SETTINGS_GROUP_STYLE)
         execution_layout = QFormLayout(execution_group)
 
         # Количество циклов
@@ -121,7 +117,6 @@ class BotSettingsDialog(QDialog):
 
         # Группа эмуляторов
         emulators_group = create_group_box("Настройки эмуляторов")
-        emulators_group.setStyleSheet(SETTINGS_GROUP_STYLE)
         emulators_layout = QFormLayout(emulators_group)
 
         # Количество потоков
@@ -156,8 +151,8 @@ class BotSettingsDialog(QDialog):
 
         # Кнопки OK и Cancel
         buttons_layout = QHBoxLayout()
-        self.btn_cancel = create_button("Отмена", BASE_BUTTON_STYLE)
-        self.btn_ok = create_button("ОК", BASE_BUTTON_STYLE)
+        self.btn_cancel = create_button("Отмена", style_class="accent")
+        self.btn_ok = create_button("ОК", style_class="accent")
 
         self.btn_cancel.clicked.connect(self.reject)
         self.btn_ok.clicked.connect(self.accept)
@@ -172,10 +167,6 @@ class BotSettingsDialog(QDialog):
         """Включает или выключает панель планирования"""
         self.schedule_container.setVisible(enabled)
 
-        # Обеспечиваем видимость чекбокса - изменяем его стилизацию
-        # Это решает проблему, когда чекбокс становится невидимым на черном фоне
-        self.enable_schedule.setStyleSheet(SETTINGS_CHECKBOX_STYLE)
-
         # Если панель стала видимой, обновляем время на текущее + 1 час
         if enabled:
             self.scheduled_time.setDateTime(QDateTime.currentDateTime().addSecs(3600))
@@ -20,7 +20,7 @@ from src.gui.manager_page import ManagerPage
 from src.utils.resources import Resources
 from src.utils.exceptions import BotMakerError
 from src.controllers import BotManagerController
-from src.utils.style_constants import COLOR_BG_DARK
+from src.utils.style_constants import APPLICATION_STYLESHEET
 from src.bot_generator.service import BotMakerService
 
 
@@ -196,11 +196,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
 
     # Настраиваем стиль приложения
-    app.setStyleSheet(f"""
-        QMainWindow {{
-            background-color: {COLOR_BG_DARK};
-        }}
-    """)
+    app.setStyleSheet(APPLICATION_STYLESHEET)
 
     # Создаем простой логгер для автономного запуска
     logger = logging.getLogger('bot_maker')
@@ -18,12 +18,12 @@ from PyQt6.QtGui import QIcon, QFont, QColor, QBrush
 
 from src.utils.resources import Resources
 from src.utils.style_constants import (
-    MAIN_FRAME_STYLE, DARK_BUTTON_STYLE, TOOLTIP_STYLE, MANAGER_TABLE_HEADER_STYLE,
+    MAIN_FRAME_STYLE, DARK_BUTTON_STYLE, MANAGER_TABLE_HEADER_STYLE,
     MANAGER_QUEUE_STYLE, MANAGER_NAV_PANEL_STYLE
 )
 from src.utils.ui_factory import (
     create_title_label, create_accent_button, create_dark_button,
-    create_frame, create_label
+    create_frame, create_label, apply_style
 )
 from src.gui.widgets import ManagerQueueWidget, BotListWidget
 from src.gui.dialogs import BotSettingsDialog
@@ -61,7 +61,8 @@ class ManagerPage(QWidget):
         """Настраивает пользовательский интерфейс страницы"""
         from PyQt6.QtWidgets import QSizePolicy
 
-        self.setStyleSheet("background-color: #000000;")
+        # Фон страницы и подсказки устанавливаются одним листом стилей до создания дочерних виджетов
+        apply_style(self, "PAGE_STYLE", "TOOLTIP_STYLE")
 
         # Основной layout страницы
         main_layout = QHBoxLayout(self)
@@ -96,8 +97,6 @@ class ManagerPage(QWidget):
         self.splitter.setStretchFactor(0, 3)  # Менеджер (индекс 0) - фактор 3
         self.splitter.setStretchFactor(1, 1)  # Список ботов (индекс 1) - фактор 1
 
-        self.setStyleSheet(self.styleSheet() + TOOLTIP_STYLE)
-
         # Добавляем разделитель на страницу
         main_layout.addWidget(self.splitter)
 
@@ -9,9 +9,10 @@ from PyQt6.QtWidgets import (
     QFrame, QScrollArea, QToolBar, QToolButton, QMenu, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtGui import QFont
 
 from src.utils.style_constants import SCRIPT_SUBMODULE_ITEM_STYLE, CANVAS_MODULE_STYLE
+from src.utils.ui_factory import get_icon
 from src.utils.module_handler import ModuleHandler
 
 
@@ -82,22 +83,22 @@ class ModuleItem(QFrame):
 
         # Кнопки управления
         self.edit_btn = QToolButton()
-        self.edit_btn.setIcon(QIcon("assets/icons/edit-white.svg"))
+        self.edit_btn.setIcon(get_icon("assets/icons/edit-white.svg"))
         self.edit_btn.setToolTip("Редактировать")
         self.edit_btn.clicked.connect(lambda: self.editRequested.emit(self.index))
 
         self.delete_btn = QToolButton()
-        self.delete_btn.setIcon(QIcon("assets/icons/delete.svg"))
+        self.delete_btn.setIcon(get_icon("assets/icons/delete.svg"))
         self.delete_btn.setToolTip("Удалить")
         self.delete_btn.clicked.connect(lambda: self.deleteRequested.emit(self.index))
 
         self.up_btn = QToolButton()
-        self.up_btn.setIcon(QIcon("assets/icons/up.svg"))
+        self.up_btn.setIcon(get_icon("assets/icons/up.svg"))
         self.up_btn.setToolTip("Переместить вверх")
         self.up_btn.clicked.connect(lambda: self.moveUpRequested.emit(self.index))
 
         self.down_btn = QToolButton()
-        self.down_btn.setIcon(QIcon("assets/icons/down.svg"))
+        self.down_btn.setIcon(get_icon("assets/icons/down.svg"))
         self.down_btn.setToolTip("Переместить вниз")
         self.down_btn.clicked.connect(lambda: self.moveDownRequested.emit(self.index))
 
@@ -24,7 +24,7 @@ from src.utils.ui_factory import (
     create_script_button, create_group_box, create_input_field,
     create_spinbox_without_buttons, create_title_label,
     create_script_item_widget, add_script_item_buttons,
-    create_multiple_file_dialog, create_delete_button
+    open_multiple_file_dialog, create_delete_button
 )
 
 
@@ -167,9 +167,12 @@ class ImageSearchModuleDialog(QDialog):
         parent_layout.addWidget(image_settings_group)
 
     def browse_multiple_images(self):
-        """Открывает диалог выбора нескольких изображений и сразу добавляет их в список"""
-        files = create_multiple_file_dialog("Выбрать изображения", "Изображения (*.png *.jpg *.jpeg)")
+        """Открывает диалог выбора нескольких изображений, выбранные файлы добавляются в список"""
+        open_multiple_file_dialog(self, self.add_selected_images,
+                                  "Выбрать изображения", "Изображения (*.png *.jpg *.jpeg)")
 
+    def add_selected_images(self, files):
+        """Добавляет выбранные в диалоге изображения в список"""
         if files:
             # Добавляем все выбранные файлы сразу в список
             for file_path in files:
@@ -15,7 +15,8 @@ from src.utils.ui_factory import (
     create_button, create_input_field, create_group_box
 )
 from src.utils.style_constants import (
-    SCRIPT_DIALOG_BLUE_STYLE, COLOR_ERROR, COLOR_SUCCESS, BLUE_BUTTON_PANEL_STYLE
+    SCRIPT_DIALOG_BLUE_STYLE, COLOR_ERROR, COLOR_SUCCESS, COLOR_TEXT, BLUE_BUTTON_PANEL_STYLE,
+    COLOR_ERROR_HOVER_MUTED, COLOR_SUCCESS_HOVER_MUTED, generate_button_style
 )
 
 
@@ -78,31 +79,11 @@ class ScriptBlockDialog(QDialog):
         """Создает кнопки диалога с выравниванием вправо и новыми цветами"""
         buttons_layout = QHBoxLayout()
 
-        self.cancel_btn = create_button("Отмена", f"""
-            QPushButton {{
-                background-color: {COLOR_ERROR};
-                color: white;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #E55E5E;
-            }}
-        """)
-
-        self.ok_btn = create_button("Подтвердить", f"""
-            QPushButton {{
-                background-color: {COLOR_SUCCESS};
-                color: white;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #5EBF61;
-            }}
-        """)
+        self.cancel_btn = create_button("Отмена", style=generate_button_style(
+            COLOR_ERROR, COLOR_TEXT, COLOR_ERROR_HOVER_MUTED, padding="8px 16px", border=None))
+
+        self.ok_btn = create_button("Подтвердить", style=generate_button_style(
+            COLOR_SUCCESS, COLOR_TEXT, COLOR_SUCCESS_HOVER_MUTED, padding="8px 16px", border=None))
 
         self.cancel_btn.clicked.connect(self.reject)
         self.ok_btn.clicked.connect(self.accept)
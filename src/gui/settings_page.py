@@ -80,7 +80,6 @@ class SettingsPage(QWidget):
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         self.table.horizontalHeader().setFixedHeight(30)
         self.table.setColumnWidth(2, 100)  # Ширина столбца с кнопкой
-        self.table.verticalHeader().setVisible(False)
         self.table.setShowGrid(True)
 
         games_layout.addWidget(self.table)
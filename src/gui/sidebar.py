@@ -12,7 +12,7 @@ from PyQt6.QtGui import QIcon, QFont
 
 from src.utils.resources import Resources
 from src.utils.style_constants import (
-    SIDEBAR_STYLE, SIDEBAR_BUTTON_STYLE, SIDEBAR_ACTIVE_BUTTON_STYLE, SIDEBAR_ICON_STYLE
+    SIDEBAR_STYLE, SIDEBAR_ICON_STYLE
 )
 
 
@@ -33,6 +33,7 @@ class SideBar(QFrame):
             parent: Родительский виджет.
         """
         super().__init__(parent)
+        # Стиль панели включает и правила текстовых кнопок, поэтому своих стилей у них нет
         self.setStyleSheet(SIDEBAR_STYLE)
 
         # Состояние сворачивания и размеры
@@ -82,7 +83,6 @@ class SideBar(QFrame):
         # Создаем фиктивную текстовую часть кнопки для сохранения структуры
         self.burger_text = QPushButton("")
         self.burger_text.setFont(QFont("Segoe UI", 12))
-        self.burger_text.setStyleSheet(SIDEBAR_BUTTON_STYLE)
 
         # Добавляем кнопки в layout
         button_layout.addWidget(self.burger_button)
@@ -119,7 +119,6 @@ class SideBar(QFrame):
         # Создаем текстовую часть кнопки
         text_button = QPushButton(text)
         text_button.setFont(QFont("Segoe UI", 12))
-        text_button.setStyleSheet(SIDEBAR_BUTTON_STYLE)
 
         # Сохраняем ссылки на кнопки как атрибуты класса
         setattr(self, f"icon_{page_name}", icon_button)
@@ -145,14 +144,13 @@ class SideBar(QFrame):
         """
         self._current_page = page_name
 
-        # Сброс стилей всех кнопок
+        # Переключаем свойство active вместо смены листа стилей: правила уже разобраны,
+        # достаточно заново применить их к кнопке
         for name in ["manager", "create", "settings"]:
             text_button = getattr(self, f"text_{name}")
-            text_button.setStyleSheet(SIDEBAR_BUTTON_STYLE)
-
-        # Устанавливаем стиль активной кнопки
-        active_text_button = getattr(self, f"text_{page_name}")
-        active_text_button.setStyleSheet(SIDEBAR_ACTIVE_BUTTON_STYLE)
+            text_button.setProperty("active", name == page_name)
+            text_button.style().unpolish(text_button)
+            text_button.style().polish(text_button)
 
     def change_page(self, page_name):
         """
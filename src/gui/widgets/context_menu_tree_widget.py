@@ -1,9 +1,10 @@
 # src/gui/widgets/context_menu_tree_widget.py
 from PyQt6.QtWidgets import QTreeWidget, QMenu, QTreeWidgetItem
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon
 from typing import Dict, List, Optional, Any, Tuple, Callable
 
+from src.utils.ui_factory import get_icon
+
 
 class ContextMenuTreeWidget(QTreeWidget):
     """
@@ -87,7 +88,7 @@ class ContextMenuTreeWidget(QTreeWidget):
 
             # Добавляем иконку, если указана
             if 'icon_path' in item and item['icon_path']:
-                action.setIcon(QIcon(item['icon_path']))
+                action.setIcon(get_icon(item['icon_path']))
 
             # Сохраняем ID действия для обработки
             action.setProperty("item_id", item['id'])
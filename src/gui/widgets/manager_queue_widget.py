@@ -6,13 +6,13 @@
 
 from PyQt6.QtWidgets import QTreeWidgetItem, QHeaderView, QMessageBox, QAbstractItemView, QTreeWidget
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint
-from PyQt6.QtGui import QIcon, QFont, QColor, QBrush, QKeyEvent
+from PyQt6.QtGui import QFont, QColor, QBrush, QKeyEvent
 
 from src.utils.resources import Resources
 from src.utils.style_constants import (
     DARK_BUTTON_STYLE, COLOR_ERROR, COLOR_TEXT, MANAGER_QUEUE_WIDGET_STYLE
 )
-from src.utils.ui_factory import create_dark_button, create_delete_button
+from src.utils.ui_factory import create_dark_button, create_delete_button, get_icon
 from src.gui.widgets.context_menu_tree_widget import ContextMenuTreeWidget
 
 
@@ -241,7 +241,7 @@ class ManagerQueueWidget(ContextMenuTreeWidget):
         parent_item.addChild(child)
 
         # Добавляем иконку для эмулятора
-        child.setIcon(1, QIcon(Resources.get_icon_path("emulator")))
+        child.setIcon(1, get_icon(Resources.get_icon_path("emulator")))
 
         # Добавляем данные для идентификации эмулятора при контекстном меню
         child.setData(0, Qt.ItemDataRole.UserRole, emu_id)
@@ -13,7 +13,7 @@ from src.gui.main_window import MainWindow
 from src.utils.logger import setup_logger
 from src.utils.resources import Resources
 from src.utils.exceptions import BotMakerError
-from src.utils.style_constants import TOOLTIP_STYLE
+from src.utils.style_constants import APPLICATION_STYLESHEET
 
 # Константы
 APP_NAME = "BOT Maker"
@@ -80,20 +80,22 @@ def main() -> None:
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
 
-    # Применение глобального стиля для QToolTip
-    app.setStyleSheet(TOOLTIP_STYLE)
+    # Глобальный стиль приложения (QToolTip, страницы по objectName) и стиль темы из файла
+    # собираются в один лист, чтобы Qt разобрал и применил его один раз
+    stylesheet = APPLICATION_STYLESHEET
 
     # Загрузка стиля приложения
     style_path = Resources.get_style_path(DEFAULT_STYLE)
     if os.path.exists(style_path):
         logger.info(f"Загрузка стиля: {style_path}")
         with open(style_path, "r", encoding="utf-8") as f:
-            qss = f.read()
-            # Добавляем к существующему стилю, чтобы сохранить стиль для QToolTip
-            app.setStyleSheet(app.styleSheet() + qss)
+            # Добавляем к глобальным правилам, чтобы сохранить их
+            stylesheet += f.read()
     else:
         logger.warning(f"Файл стилей не найден: {style_path}")
 
+    app.setStyleSheet(stylesheet)
+
     try:
         # Создаём и показываем главное окно
         main_window = MainWindow(logger)
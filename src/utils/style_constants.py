@@ -3,6 +3,13 @@
 Использует генераторы стилей для уменьшения дублирования кода.
 """
 
+import re
+import sys
+from functools import lru_cache
+from operator import methodcaller
+from string import Template
+from types import MappingProxyType
+
 # ======== ОСНОВНЫЕ ЦВЕТА И ПЕРЕМЕННЫЕ ========
 
 # Основные цвета
@@ -11,12 +18,17 @@ COLOR_SECONDARY = "#4C7BD9"  # Синий (для синей темы)
 COLOR_ERROR = "#FF4444"  # Красный (для ошибок и удаления)
 COLOR_SUCCESS = "#44BB44"  # Зеленый (для успеха)
 COLOR_WARNING = "#FFB347"  # Светло-оранжевый (для предупреждений)
+COLOR_ERROR_HOVER = "#FF6666"  # Красный при наведении
+COLOR_SUCCESS_HOVER = "#66CC66"  # Зеленый при наведении
+COLOR_ERROR_HOVER_MUTED = "#E55E5E"  # Приглушенный красный при наведении (кнопки скрипт-блоков)
+COLOR_SUCCESS_HOVER_MUTED = "#5EBF61"  # Приглушенный зеленый при наведении (кнопки скрипт-блоков)
 
 # Темные фоны
 COLOR_BG_DARK = "#000000"  # Основной фон приложения
 COLOR_BG_DARK_1 = "#1E1E1E"  # Основной фон фреймов
 COLOR_BG_DARK_2 = "#2A2A2A"  # Фон полей ввода и элементов
 COLOR_BG_DARK_3 = "#333333"  # Фон заголовков и более светлых областей
+COLOR_BG_CANVAS = "#252525"  # Фон холстов и панелей навигации
 
 # Границы
 COLOR_BORDER = "#444444"  # Основные границы
@@ -26,6 +38,24 @@ COLOR_BORDER_LIGHT = "#555555"  # Светлые границы
 COLOR_TEXT = "#FFFFFF"  # Основной текст
 COLOR_TEXT_SECONDARY = "#CCCCCC"  # Вторичный текст
 
+# Полупрозрачная подсветка при наведении и для активных элементов
+COLOR_HOVER_WHITE_SUBTLE = "rgba(255, 255, 255, 0.1)"
+COLOR_HOVER_WHITE = "rgba(255, 255, 255, 0.2)"
+COLOR_ACTIVE_WHITE = "rgba(255, 255, 255, 0.15)"
+COLOR_ACTIVE_WHITE_HOVER = "rgba(255, 255, 255, 0.25)"
+COLOR_HOVER_ORANGE = "rgba(255, 165, 0, 0.2)"
+COLOR_HOVER_RED = "rgba(255, 68, 68, 0.2)"
+COLOR_HOVER_BLUE = "rgba(76, 123, 217, 0.3)"
+
+# Графитовая схема дерева очереди и календаря
+COLOR_SLATE_BG = "#2D2D30"  # Фон
+COLOR_SLATE_BG_LIGHT = "#3A3A3D"  # Фон кнопок и родительских строк
+COLOR_SLATE_BORDER = "#3E3E42"  # Границы и разделители
+COLOR_SLATE_BORDER_LIGHT = "#505054"  # Границы кнопок
+COLOR_SLATE_SELECTION = "#3A6EA5"  # Выделение
+COLOR_SLATE_HOVER = "#2C5175"  # Строка под курсором
+COLOR_SLATE_TEXT_DISABLED = "#777777"  # Недоступные даты календаря
+
 # Синяя тема
 COLOR_BLUE_BG = "#1E2B3C"  # Фон синей темы
 COLOR_BLUE_ACCENT = "#4C7BD9"  # Акцент синей темы
@@ -40,18 +70,55 @@ PADDING_STANDARD = "6px 10px"
 PADDING_SMALL = "4px"
 FONT_WEIGHT_BOLD = "font-weight: bold;"
 
+# ======== ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ========
+
+# Комментарии, отступы и переводы строк в стилях нужны только для читаемости исходника
+_COMMENTS = re.compile(r"/\*.*?\*/", re.DOTALL)
+# После схлопывания пробелов вокруг знака остается не больше одного пробела,
+# поэтому их убирает обычная замена подстрок без регулярного выражения
+_SPACES_AROUND_PUNCTUATION = tuple(pair for ch in "{};:," for pair in ((" " + ch, ch), (ch + " ", ch)))
+# После удаления пробелов объявление начинается с начала строки, после "{" или ";",
+# поэтому проверка этого условия сразу отсекает остальные позиции
+_REPEATED_DECLARATIONS = re.compile(r"(?<![^{;])([\w-]+:[^;{}]*;)\1+")
+# Замена функцией на C не разбирает шаблон r"\1" заново для каждого совпадения
+_FIRST_GROUP = methodcaller("group", 1)
+
+
+def _minify(qss):
+    """
+    Убирает комментарии, декоративные пробелы и повторяющиеся подряд объявления,
+    чтобы Qt разбирал меньше символов.
+    Результат интернируется: одинаковые стили разделяют одну строку.
+    """
+    if "/*" in qss:
+        qss = _COMMENTS.sub("", qss)
+    qss = " ".join(qss.split())
+    for spaced, bare in _SPACES_AROUND_PUNCTUATION:
+        qss = qss.replace(spaced, bare)
+    qss = _REPEATED_DECLARATIONS.sub(_FIRST_GROUP, qss)
+    return sys.intern(qss.replace(";}", "}"))
+
+
+def _button_variant(style, name):
+    """Переносит правила кнопки на селектор QPushButton[styleClass="name"]."""
+    return style.replace("QPushButton", f'QPushButton[styleClass="{name}"]')
+
 # ======== ГЕНЕРАТОРЫ СТИЛЕЙ ========
 
+# Генераторы кэшируются: одинаковые наборы параметров возвращают уже собранную строку
+
+@lru_cache(maxsize=128)
 def generate_button_style(bg_color, text_color, hover_color=None, border_radius=BORDER_RADIUS,
                           padding=PADDING_STANDARD, font_weight="bold", border="none", extra_css=""):
-    """Генерирует стиль для кнопки на основе параметров."""
+    """Генерирует стиль для кнопки на основе параметров (border=None не задает рамку)."""
     hover_color = hover_color or bg_color
+    border_css = f"border: {border};" if border else ""
 
-    return f"""
+    return _minify(f"""
         QPushButton {{
             background-color: {bg_color};
             color: {text_color};
-            border: {border};
+            {border_css}
             border-radius: {border_radius};
             padding: {padding};
             font-weight: {font_weight};
@@ -60,14 +127,15 @@ def generate_button_style(bg_color, text_color, hover_color=None, border_radius=
         QPushButton:hover {{
             background-color: {hover_color};
         }}
-    """
+    """)
 
+@lru_cache(maxsize=128)
 def generate_input_style(bg_color=COLOR_BG_DARK_2, text_color=COLOR_TEXT, border_color=COLOR_BORDER,
                          border_radius="3px", padding=PADDING_SMALL, min_height=None, extra_css=""):
     """Генерирует стиль для текстовых полей и других компонентов ввода."""
     height_css = f"min-height: {min_height}; max-height: {min_height};" if min_height else ""
 
-    return f"""
+    return _minify(f"""
         background-color: {bg_color}; 
         color: {text_color}; 
         padding: {padding};
@@ -75,8 +143,9 @@ def generate_input_style(bg_color=COLOR_BG_DARK_2, text_color=COLOR_TEXT, border
         border-radius: {border_radius};
         {height_css}
         {extra_css}
-    """
+    """)
 
+@lru_cache(maxsize=128)
 def generate_container_style(bg_color, border_color=None, border_radius="8px", padding=None,
                              margin=None, extra_css=""):
     """Генерирует стиль для контейнеров (фреймы, группы и т.д.)."""
@@ -84,40 +153,43 @@ def generate_container_style(bg_color, border_color=None, border_radius="8px", p
     padding_css = f"padding: {padding};" if padding else ""
     margin_css = f"margin: {margin};" if margin else ""
 
-    return f"""
+    return _minify(f"""
         background-color: {bg_color}; 
         border-radius: {border_radius};
         {border_css}
         {padding_css}
         {margin_css}
         {extra_css}
-    """
+    """)
 
+@lru_cache(maxsize=128)
 def generate_group_box_style(title_color=COLOR_PRIMARY, border_color=COLOR_BORDER,
-                           border_radius=BORDER_RADIUS, margin_top="8px", title_position="left",
-                           title_offset="6px", extra_css=""):
+                           border_radius=BORDER_RADIUS, margin_top="8px",
+                           title_position="left", title_offset="6px", extra_css="",
+                           padding_top="8px", title_padding="0 3px"):
     """Генерирует стиль для группировочных боксов."""
-    return f"""
+    return _minify(f"""
         {FONT_WEIGHT_BOLD}
         color: {title_color};
         border: 1px solid {border_color};
         border-radius: {border_radius};
         margin-top: {margin_top};
-        padding-top: 8px;
+        padding-top: {padding_top};
         {extra_css}
     }}
     QGroupBox::title {{
         subcontrol-origin: margin;
         {title_position}: {title_offset};
-        padding: 0 3px;
-    """
+        padding: {title_padding};
+    """)
 
+@lru_cache(maxsize=128)
 def generate_table_style(bg_color=COLOR_BG_DARK_2, text_color=COLOR_TEXT,
                         grid_color=COLOR_BORDER, header_bg=COLOR_BG_DARK_3,
                         header_color=COLOR_PRIMARY, selected_bg=COLOR_PRIMARY,
                         selected_text=COLOR_TEXT, extra_css=""):
     """Генерирует стиль для таблиц."""
-    return f"""
+    return _minify(f"""
         QTableWidget {{
             background-color: {bg_color};
             color: {text_color};
@@ -135,10 +207,11 @@ def generate_table_style(bg_color=COLOR_BG_DARK_2, text_color=COLOR_TEXT,
             background-color: {selected_bg};
             color: {selected_text};
         }}
-    """
+    """)
 
+@lru_cache(maxsize=128)
 def generate_tool_button_style(bg_color="transparent", text_color=COLOR_TEXT,
-                             hover_bg="rgba(255, 255, 255, 0.1)", hover_radius="3px",
+                             hover_bg=COLOR_HOVER_WHITE_SUBTLE, hover_radius="3px",
                              size=None, extra_css=""):
     """Генерирует стиль для кнопок инструментов."""
     size_css = f"""
@@ -148,7 +221,7 @@ def generate_tool_button_style(bg_color="transparent", text_color=COLOR_TEXT,
         max-height: {size}px;
     """ if size else ""
 
-    return f"""
+    return _minify(f"""
         QToolButton {{
             background-color: {bg_color};
             border: none;
@@ -160,14 +233,15 @@ def generate_tool_button_style(bg_color="transparent", text_color=COLOR_TEXT,
             background-color: {hover_bg};
             border-radius: {hover_radius};
         }}
-    """
+    """)
 
+@lru_cache(maxsize=128)
 def generate_combobox_style(bg_color=COLOR_BG_DARK_2, text_color=COLOR_TEXT,
                           border_color=COLOR_BORDER, popup_bg=COLOR_BG_DARK_2,
                           selection_bg=COLOR_PRIMARY, padding=PADDING_SMALL,
                           border_radius="3px", extra_css=""):
     """Генерирует стиль для выпадающих списков."""
-    return f"""
+    return _minify(f"""
         QComboBox {{
             background-color: {bg_color};
             color: {text_color}; 
@@ -182,14 +256,15 @@ def generate_combobox_style(bg_color=COLOR_BG_DARK_2, text_color=COLOR_TEXT,
             border: 1px solid {border_color};
             selection-background-color: {selection_bg};
         }}
-    """
+    """)
 
+@lru_cache(maxsize=128)
 def generate_dialog_style(bg_color=COLOR_BG_DARK_1, text_color=COLOR_TEXT,
                         group_title_color=COLOR_PRIMARY, border_color=COLOR_BORDER,
                         tooltip_bg=COLOR_BG_DARK_2, tooltip_border=COLOR_PRIMARY,
                         extra_css=""):
     """Генерирует стиль для диалогов."""
-    return f"""
+    return _minify(f"""
         QDialog {{
             background-color: {bg_color};
             color: {text_color};
@@ -208,809 +283,895 @@ def generate_dialog_style(bg_color=COLOR_BG_DARK_1, text_color=COLOR_TEXT,
             padding: 2px;
             opacity: 200;
         }}
+    """)
+
+# ======== ШАБЛОНЫ СТИЛЕЙ ========
+
+# Палитра по умолчанию: значения для подстановки в шаблоны ($primary, $bg_dark_2, $bold и т.д.).
+# Для другой темы достаточно передать в get_style словарь с теми же ключами.
+# Сама палитра неизменяема, поэтому готовые стили, закэшированные для нее, не устаревают.
+DEFAULT_PALETTE = MappingProxyType({
+    "primary": COLOR_PRIMARY,
+    "secondary": COLOR_SECONDARY,
+    "error": COLOR_ERROR,
+    "success": COLOR_SUCCESS,
+    "warning": COLOR_WARNING,
+    "error_hover": COLOR_ERROR_HOVER,
+    "success_hover": COLOR_SUCCESS_HOVER,
+    "error_hover_muted": COLOR_ERROR_HOVER_MUTED,
+    "success_hover_muted": COLOR_SUCCESS_HOVER_MUTED,
+    "bg_dark": COLOR_BG_DARK,
+    "bg_dark_1": COLOR_BG_DARK_1,
+    "bg_dark_2": COLOR_BG_DARK_2,
+    "bg_dark_3": COLOR_BG_DARK_3,
+    "bg_canvas": COLOR_BG_CANVAS,
+    "border": COLOR_BORDER,
+    "border_light": COLOR_BORDER_LIGHT,
+    "text": COLOR_TEXT,
+    "text_secondary": COLOR_TEXT_SECONDARY,
+    "hover_white_subtle": COLOR_HOVER_WHITE_SUBTLE,
+    "hover_white": COLOR_HOVER_WHITE,
+    "active_white": COLOR_ACTIVE_WHITE,
+    "active_white_hover": COLOR_ACTIVE_WHITE_HOVER,
+    "hover_orange": COLOR_HOVER_ORANGE,
+    "hover_red": COLOR_HOVER_RED,
+    "hover_blue": COLOR_HOVER_BLUE,
+    "slate_bg": COLOR_SLATE_BG,
+    "slate_bg_light": COLOR_SLATE_BG_LIGHT,
+    "slate_border": COLOR_SLATE_BORDER,
+    "slate_border_light": COLOR_SLATE_BORDER_LIGHT,
+    "slate_selection": COLOR_SLATE_SELECTION,
+    "slate_hover": COLOR_SLATE_HOVER,
+    "slate_text_disabled": COLOR_SLATE_TEXT_DISABLED,
+    "blue_bg": COLOR_BLUE_BG,
+    "blue_accent": COLOR_BLUE_ACCENT,
+    "blue_highlight": COLOR_BLUE_HIGHLIGHT,
+    "blue_bg_light": COLOR_BLUE_BG_LIGHT,
+    "blue_text": COLOR_BLUE_TEXT,
+    "bold": FONT_WEIGHT_BOLD,
+})
+
+# Палитры тем по имени. Палитру нужно зарегистрировать до первого обращения
+# к ее стилям: готовые стили кэшируются по имени палитры
+PALETTES = {
+    "dark": DEFAULT_PALETTE,
+}
+
+# Именованные шаблоны публичных стилей: имя стиля -> Template со встроенными фрагментами.
+# Фрагменты (_TOOLTIP_TEMPLATE и т.п.) здесь не регистрируются
+_TEMPLATES = {}
+
+
+def _define(name, template, **fragments):
     """
+    Регистрирует шаблон стиля под именем константы.
+    Фрагменты встраиваются в текст шаблона сразу, а значения палитры подставляются
+    в уже собранный текст, поэтому фрагменты получают цвета той же палитры.
+
+    Args:
+        name: Имя стиля
+        template: Текст шаблона с подстановками вида $primary
+        **fragments: Тексты шаблонов фрагментов, встраиваемые вместо $имя_фрагмента
+    """
+    _TEMPLATES[name] = Template(Template(template).safe_substitute(fragments))
+
+
+def get_style(name, palette=None):
+    """
+    Возвращает стиль, собранный из именованного шаблона для заданной палитры.
+    Стили именованных палитр кэшируются (см. compile_qss), поэтому смена темы
+    не пересобирает уже готовые стили.
+
+    Args:
+        name: Имя стиля (например, "TITLE_STYLE")
+        palette: Имя палитры из PALETTES или словарь значений для подстановки
+            (по умолчанию "dark")
+
+    Returns:
+        str: Готовый стиль
+    """
+    if palette is None or isinstance(palette, str):
+        return compile_qss(name, palette or "dark")
+
+    # Произвольный словарь не кэшируется: такие палитры создаются на лету,
+    # и кэш по ним рос бы без ограничений
+    return _minify(_TEMPLATES[name].substitute(palette))
+
+
+@lru_cache(maxsize=None)
+def compile_qss(name, palette="dark"):
+    """
+    Возвращает стиль для палитры, заданной именем темы.
+    Ключ кэша состоит из двух имен, поэтому размер кэша ограничен числом стилей и палитр,
+    а повторные вызовы возвращают один и тот же объект строки.
+
+    Args:
+        name: Имя стиля (например, "MODULE_ITEM_STYLE")
+        palette: Имя палитры из PALETTES
+
+    Returns:
+        str: Готовый стиль
+    """
+    return _minify(_TEMPLATES[name].substitute(PALETTES[palette]))
+
+
+@lru_cache(maxsize=None)
+def combine_styles(*names):
+    """
+    Склеивает несколько стилей модуля в один лист стилей.
+    Для одного и того же набора имен возвращается один и тот же объект строки.
+
+    Args:
+        *names: Имена стилей (например, "PAGE_STYLE", "TOOLTIP_STYLE")
+
+    Returns:
+        str: Объединенный стиль
+    """
+    module = sys.modules[__name__]
+    return sys.intern(" ".join(getattr(module, name) for name in names))
+
+
+def get_styles(palette=None):
+    """
+    Возвращает все публичные стили модуля, собранные для палитры.
+    Набор для именованной палитры собирается один раз, поэтому повторное
+    переключение на тему сводится к замене ссылки на готовый словарь.
+
+    Args:
+        palette: Имя палитры из PALETTES или словарь значений для подстановки
+            (по умолчанию "dark")
+
+    Returns:
+        Mapping: Неизменяемый словарь {имя стиля: стиль}
+    """
+    if palette is None or isinstance(palette, str):
+        return _theme_styles(palette or "dark")
+
+    return MappingProxyType({name: get_style(name, palette) for name in _TEMPLATES})
+
+
+@lru_cache(maxsize=None)
+def _theme_styles(palette):
+    """Собирает набор стилей для палитры из PALETTES (один раз на имя палитры)."""
+    return MappingProxyType({name: compile_qss(name, palette) for name in _TEMPLATES})
+
+
+def _style(name, template, **fragments):
+    """Регистрирует шаблон и возвращает стиль для палитры по умолчанию."""
+    _define(name, template, **fragments)
+    return get_style(name)
+
+
+def _alias(name, source):
+    """Регистрирует старое имя стиля с шаблоном стиля source и возвращает тот же стиль."""
+    _TEMPLATES[name] = _TEMPLATES[source]
+    return get_style(name)
 
 # ======== БАЗОВЫЕ СТИЛИ КОМПОНЕНТОВ ========
 
+# Фрагменты, из которых составляются другие стили, хранятся шаблонами: генераторы получают
+# подстановки палитры ($primary и т.д.) вместо цветов, и стиль со встроенным фрагментом
+# собирается для любой палитры
+
 # Общий стиль для оранжевых кнопок
-BASE_ORANGE_BUTTON = generate_button_style(COLOR_PRIMARY, "black")
+_ORANGE_BUTTON_TEMPLATE = generate_button_style("$primary", "black")
 
 # Общий стиль для темных кнопок
-BASE_DARK_BUTTON = generate_button_style(COLOR_BG_DARK_2, COLOR_TEXT, COLOR_BG_DARK_3,
-                                         border="1px solid " + COLOR_TEXT, border_radius="3px",
-                                         padding="5px 10px", font_weight="normal")
+_DARK_BUTTON_TEMPLATE = generate_button_style("$bg_dark_2", "$text", "$bg_dark_3",
+                                              border="1px solid $text", border_radius="3px",
+                                              padding="5px 10px", font_weight="normal")
+
+# Красная кнопка удаления
+_DELETE_BUTTON_TEMPLATE = generate_button_style("$error", "$text", "$error_hover")
 
 # Общий стиль для полей ввода
-BASE_INPUT = generate_input_style()
+_INPUT_TEMPLATE = generate_input_style("$bg_dark_2", "$text", "$border")
 
 # Общий стиль для фреймов
-BASE_FRAME = generate_container_style(COLOR_BG_DARK_1, COLOR_BORDER)
+_FRAME_TEMPLATE = generate_container_style("$bg_dark_1", "$border")
 
 # Общий стиль для группбоксов
-BASE_GROUP_BOX = generate_group_box_style()
+_GROUP_BOX_TEMPLATE = generate_group_box_style("$primary", "$border")
 
 # Общий стиль для подсказок
-BASE_TOOLTIP = f"""
-    background-color: {COLOR_BG_DARK_2};
-    color: {COLOR_TEXT};
-    border: 1px solid {COLOR_PRIMARY};
+_TOOLTIP_TEMPLATE = _minify("""
+    background-color: $bg_dark_2;
+    color: $text;
+    border: 1px solid $primary;
     padding: 2px;
-"""
+""")
+
+# Правило подсказок для QApplication и страниц
+_TOOLTIP_RULE_TEMPLATE = _minify("QToolTip { " + _TOOLTIP_TEMPLATE + " }")
+
+# Правило подсказок в диалогах
+_DIALOG_TOOLTIP_TEMPLATE = _minify("QToolTip { " + _TOOLTIP_TEMPLATE + " opacity: 200; }")
 
 # Общий стиль для кнопок инструментов
-BASE_TOOL_BUTTON = generate_tool_button_style(size=20)
+_TOOL_BUTTON_TEMPLATE = generate_tool_button_style(text_color="$text", hover_bg="$hover_white_subtle", size=20)
 
-# ======== КОНКРЕТНЫЕ СТИЛИ КОМПОНЕНТОВ ========
+# Варианты кнопок для листов стилей диалогов: кнопка выбирает вариант свойством styleClass
+# и не получает собственный лист стилей, поэтому Qt разбирает правила один раз на диалог
+_BUTTON_VARIANTS_TEMPLATE = _minify(" ".join((
+    _button_variant(_ORANGE_BUTTON_TEMPLATE, "accent"),
+    _button_variant(_DARK_BUTTON_TEMPLATE, "dark"),
+    _button_variant(_DELETE_BUTTON_TEMPLATE, "delete"),
+)))
 
-# Стили для диалогов
-BASE_DIALOG_STYLE = generate_dialog_style()
+# ======== КОНКРЕТНЫЕ СТИЛИ КОМПОНЕНТОВ ========
 
 # Стили для кнопок
-BASE_BUTTON_STYLE = BASE_ORANGE_BUTTON
+BASE_BUTTON_STYLE = _style("BASE_BUTTON_STYLE", _ORANGE_BUTTON_TEMPLATE)
+
+DARK_BUTTON_STYLE = _style("DARK_BUTTON_STYLE", _DARK_BUTTON_TEMPLATE)
 
-DARK_BUTTON_STYLE = BASE_DARK_BUTTON
+DELETE_BUTTON_STYLE = _style("DELETE_BUTTON_STYLE", _DELETE_BUTTON_TEMPLATE)
 
-DELETE_BUTTON_STYLE = generate_button_style(COLOR_ERROR, COLOR_TEXT, "#FF6666")
+# Компактная кнопка команды для панелей инструментов
+COMMAND_BUTTON_STYLE = _style("COMMAND_BUTTON_STYLE", """
+    QPushButton {
+        background-color: $bg_dark_3;
+        color: $text;
+        border-radius: 3px;
+        padding: 3px 6px;
+        font-size: 11px;
+    }
+    QPushButton:hover {
+        background-color: $border;
+        border: 1px solid $primary;
+    }
+""")
+
+# Варианты кнопок для листов стилей диалогов
+BUTTON_VARIANTS_STYLE = _style("BUTTON_VARIANTS_STYLE", _BUTTON_VARIANTS_TEMPLATE)
+
+# Стили для диалогов
+BASE_DIALOG_STYLE = _style("BASE_DIALOG_STYLE", "$dialog $button_variants",
+                           dialog=generate_dialog_style("$bg_dark_1", "$text", "$primary", "$border",
+                                                        "$bg_dark_2", "$primary"),
+                           button_variants=_BUTTON_VARIANTS_TEMPLATE)
 
 # Стили для полей ввода
-BASE_INPUT_STYLE = generate_input_style(min_height="22px")
+BASE_INPUT_STYLE = _style("BASE_INPUT_STYLE", "$input min-height: 22px; max-height: 22px;", input=_INPUT_TEMPLATE)
 
-# Стили для спинбоксов
-BASE_SPINBOX_STYLE = generate_input_style(min_height="22px")
+# Стили для спинбоксов (совпадают с полями ввода)
+BASE_SPINBOX_STYLE = _alias("BASE_SPINBOX_STYLE", "BASE_INPUT_STYLE")
 
 # Стили для комбобоксов
-BASE_COMBOBOX_STYLE = generate_combobox_style()
+BASE_COMBOBOX_STYLE = _style("BASE_COMBOBOX_STYLE", generate_combobox_style("$bg_dark_2", "$text", "$border",
+                                                                           "$bg_dark_2", "$primary"))
 
 # Стили для таблиц
-BASE_TABLE_STYLE = generate_table_style()
+BASE_TABLE_STYLE = _style("BASE_TABLE_STYLE", generate_table_style("$bg_dark_2", "$text", "$border", "$bg_dark_3",
+                                                                  "$primary", "$primary", "$text"))
 
 # Стиль для основных фреймов
-MAIN_FRAME_STYLE = BASE_FRAME
+MAIN_FRAME_STYLE = _style("MAIN_FRAME_STYLE", _FRAME_TEMPLATE)
 
 # Стиль для подсказок
-TOOLTIP_STYLE = f"""
-    QToolTip {{
-        {BASE_TOOLTIP}
-    }}
-"""
+TOOLTIP_STYLE = _style("TOOLTIP_STYLE", _TOOLTIP_RULE_TEMPLATE)
+
+# Черный фон страницы, наследуемый всеми ее дочерними виджетами
+PAGE_STYLE = _style("PAGE_STYLE", "* { background-color: $bg_dark; }")
 
 # ======== СТИЛИ ЭЛЕМЕНТОВ ИНТЕРФЕЙСА ========
 
 # Заголовок
-TITLE_STYLE = f"""
-    color: {COLOR_PRIMARY};
+TITLE_STYLE = _style("TITLE_STYLE", """
+    color: $primary;
     font-size: 16px;
-    {FONT_WEIGHT_BOLD}
-"""
+    $bold
+""")
 
 # Стили для боковой панели
-SIDEBAR_STYLE = f"""
-    background-color: #121212;
-    border-right: 2px solid {COLOR_BG_DARK_3};
-"""
-
-SIDEBAR_BUTTON_BASE = f"""
-    color: {COLOR_TEXT};
-    border: none;
-    text-align: left;
-    padding: 5px 10px;
-    border-radius: 5px;
-"""
-
-SIDEBAR_BUTTON_STYLE = f"""
-    QPushButton {{
-        {SIDEBAR_BUTTON_BASE}
+SIDEBAR_STYLE = _style("SIDEBAR_STYLE", """
+    * {
+        background-color: #121212;
+        border-right: 2px solid $bg_dark_3;
+    }
+    /* Текстовые кнопки навигации; активная отмечается свойством active */
+    QPushButton {
+        color: $text;
+        border: none;
+        text-align: left;
+        padding: 5px 10px;
+        border-radius: 5px;
         background: transparent;
-    }}
-    QPushButton:hover {{
-        background-color: rgba(255, 255, 255, 0.2);
-    }}
-"""
-
-SIDEBAR_ACTIVE_BUTTON_STYLE = f"""
-    QPushButton {{
-        {SIDEBAR_BUTTON_BASE}
-        background-color: rgba(255, 255, 255, 0.15);
-        {FONT_WEIGHT_BOLD}
-    }}
-    QPushButton:hover {{
-        background-color: rgba(255, 255, 255, 0.25);
-    }}
-"""
-
-SIDEBAR_ICON_STYLE = generate_tool_button_style(hover_bg="rgba(255, 255, 255, 0.2)", hover_radius="4px")
-
-# Обновленный стиль акцентных кнопок (используем базовый)
-ACCENT_BUTTON_STYLE = BASE_BUTTON_STYLE
+    }
+    QPushButton:hover {
+        background-color: $hover_white;
+    }
+    QPushButton[active="true"] {
+        background-color: $active_white;
+        $bold
+    }
+    QPushButton[active="true"]:hover {
+        background-color: $active_white_hover;
+    }
+""")
 
-# Стиль для кнопок в диалогах модулей (используем базовый)
-MODULE_BUTTON_STYLE = BASE_BUTTON_STYLE
+SIDEBAR_ICON_STYLE = _style("SIDEBAR_ICON_STYLE", generate_tool_button_style(text_color="$text", hover_bg="$hover_white",
+                                                                          hover_radius="4px"))
 
 # Стиль для групп в форме
-FORM_GROUP_STYLE = f"""
-    QGroupBox {{
-        {BASE_GROUP_BOX}
-    }}
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        left: 6px;
-        padding: 0 3px;
-        color: {COLOR_PRIMARY};
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
-    }}
-"""
+FORM_GROUP_STYLE = _style("FORM_GROUP_STYLE", """
+    QGroupBox {
+        $base_group_box
+        /* Фрагмент заканчивается правилом QGroupBox::title, цвет заголовка дописывается в него */
+        color: $primary;
+    }
+    QLabel {
+        color: $text;
+    }
+""", base_group_box=_GROUP_BOX_TEMPLATE)
 
 # Стиль для элементов ModuleItem
-MODULE_ITEM_STYLE = f"""
-    ModuleItem {{
-        background-color: {COLOR_BG_DARK_2};
-        border: 1px solid {COLOR_BORDER_LIGHT};
+MODULE_ITEM_STYLE = _style("MODULE_ITEM_STYLE", """
+    ModuleItem {
+        background-color: $bg_dark_2;
+        border: 1px solid $border_light;
         border-radius: 3px;
         margin: 2px;
-    }}
-    ModuleItem:hover {{
-        border: 1px solid {COLOR_PRIMARY};
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
+    }
+    ModuleItem:hover {
+        border: 1px solid $primary;
+    }
+    QLabel {
+        color: $text;
         padding: 2px;
-    }}
-    QToolButton {{
-        {BASE_TOOL_BUTTON}
-        icon-size: 16px;
-        padding: 1px;
-    }}
-    QToolButton:hover {{
-        background-color: rgba(255, 165, 0, 0.2);
-        border-radius: 2px;
-    }}
-"""
+    }
+    $tool_button
+""", tool_button=generate_tool_button_style(text_color="$text", hover_bg="$hover_orange", hover_radius="2px",
+                                            size=20, extra_css="icon-size: 16px; padding: 1px;"))
 
 # Стиль для кнопок инструментов
-TOOL_BUTTON_STYLE = BASE_TOOL_BUTTON
+TOOL_BUTTON_STYLE = _style("TOOL_BUTTON_STYLE", _TOOL_BUTTON_TEMPLATE)
 
 # Стиль для холста модулей активности
-ACTIVITY_CANVAS_STYLE = generate_container_style("#252525", COLOR_BORDER_LIGHT, "4px")
+ACTIVITY_CANVAS_STYLE = _style("ACTIVITY_CANVAS_STYLE", generate_container_style("$bg_canvas", "$border_light", "4px"))
 
 # Стиль для диалога активности
-ACTIVITY_DIALOG_STYLE = f"""
-    QDialog {{
-        background-color: {COLOR_BG_DARK_2};
-        color: {COLOR_TEXT};
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
-    }}
-    QGroupBox {{
-        {FONT_WEIGHT_BOLD}
-        color: {COLOR_PRIMARY};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        border-radius: 4px;
-        margin-top: 15px;
-        padding-top: 15px;
-    }}
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        left: 10px;
-        padding: 0 5px;
-    }}
-    QLineEdit, QSpinBox, QDoubleSpinBox {{
-        background-color: #333;
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        border-radius: 3px;
-    }}
-    QComboBox {{
-        background-color: #333;
-        color: {COLOR_TEXT}; 
-        border: 1px solid {COLOR_BORDER_LIGHT};
+ACTIVITY_DIALOG_STYLE = _style("ACTIVITY_DIALOG_STYLE", """
+    QDialog {
+        background-color: $bg_dark_2;
+        color: $text;
+    }
+    QLabel {
+        color: $text;
+    }
+    QGroupBox {
+        $group_box
+    }
+    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
+        background-color: $bg_dark_3;
+        color: $text;
+        border: 1px solid $border_light;
         border-radius: 3px;
+    }
+    QComboBox {
         padding: 4px;
-    }}
-    QPushButton {{
-        {BASE_ORANGE_BUTTON}
-    }}
-    QPushButton:hover {{
-        background-color: {COLOR_WARNING};
-    }}
-    QCheckBox {{
-        color: {COLOR_TEXT};
+    }
+    $orange_button
+    QCheckBox {
+        color: $text;
         spacing: 5px;
-    }}
-    QCheckBox::indicator {{
+    }
+    QCheckBox::indicator {
         width: 14px;
         height: 14px;
-    }}
-    QToolTip {{
-        {BASE_TOOLTIP}
-        opacity: 200;
-    }}
-"""
-
-# Стиль для страницы создания бота
-CREATE_BOT_STYLE = f"""
-    QWidget#createBotPage {{
-        background-color: {COLOR_BG_DARK};
-    }}
-"""
-
-# Стиль для кнопок в таблице
-TABLE_ACTION_BUTTON_STYLE = generate_button_style("#222222", COLOR_TEXT, "#333333",
-                                                border="1px solid " + COLOR_TEXT,
-                                                border_radius="2px", padding="4px 8px",
-                                                font_weight="normal")
+    }
+    $dialog_tooltip
+    $button_variants
+""", group_box=generate_group_box_style("$primary", "$border_light", margin_top="15px", padding_top="15px",
+                                       title_offset="10px", title_padding="0 5px"),
+               orange_button=generate_button_style("$primary", "black", "$warning"),
+               dialog_tooltip=_DIALOG_TOOLTIP_TEMPLATE, button_variants=_BUTTON_VARIANTS_TEMPLATE)
 
 # ======== СТИЛИ ДЛЯ СКРИПТОВ ========
 
 # Стиль для элементов скрипта
-SCRIPT_ITEM_STYLE = f"""
-    QFrame {{
-        background-color: {COLOR_BG_DARK_2};
-        border: 1px solid {COLOR_BORDER_LIGHT};
+SCRIPT_ITEM_STYLE = _style("SCRIPT_ITEM_STYLE", """
+    QFrame {
+        background-color: $bg_dark_2;
+        border: 1px solid $border_light;
         border-radius: 3px;
         margin: 2px;
-    }}
-    QFrame:hover {{
-        border: 1px solid {COLOR_PRIMARY};
-    }}
-"""
+    }
+    QFrame:hover {
+        border: 1px solid $primary;
+    }
+""")
 
 # Стиль для заголовка элемента скрипта
-SCRIPT_ITEM_HEADER_STYLE = f"""
-    color: {COLOR_PRIMARY}; 
-    {FONT_WEIGHT_BOLD}
-"""
+SCRIPT_ITEM_HEADER_STYLE = _style("SCRIPT_ITEM_HEADER_STYLE", """
+    color: $primary; 
+    $bold
+""")
 
 # Стиль для описания элемента скрипта
-SCRIPT_ITEM_DESCRIPTION_STYLE = f"""
-    color: {COLOR_TEXT_SECONDARY}; 
+SCRIPT_ITEM_DESCRIPTION_STYLE = _style("SCRIPT_ITEM_DESCRIPTION_STYLE", """
+    color: $text_secondary; 
     font-size: 11px; 
     margin-left: 24px;
-"""
+""")
+
+# Стиль для кнопок панели инструментов скрипта
+SCRIPT_BUTTON_STYLE = _style("SCRIPT_BUTTON_STYLE", """
+    QPushButton {
+        background-color: $primary;
+        color: black;
+        border-radius: 3px;
+        padding: 5px 10px;
+        $bold
+    }
+    QPushButton:hover {
+        background-color: $warning;
+    }
+""")
 
 # Стиль для кнопок в элементе скрипта
-SCRIPT_ITEM_BUTTON_STYLE = generate_tool_button_style(hover_bg="rgba(255, 165, 0, 0.2)", hover_radius="2px")
+SCRIPT_ITEM_BUTTON_STYLE = _style("SCRIPT_ITEM_BUTTON_STYLE", generate_tool_button_style(
+    text_color="$text", hover_bg="$hover_orange", hover_radius="2px"))
 
 # Стиль для кнопки удаления в элементе скрипта
-SCRIPT_ITEM_DELETE_BUTTON_STYLE = generate_tool_button_style(text_color=COLOR_ERROR,
-                                                           hover_bg="rgba(255, 68, 68, 0.2)",
-                                                           hover_radius="2px")
+SCRIPT_ITEM_DELETE_BUTTON_STYLE = _style("SCRIPT_ITEM_DELETE_BUTTON_STYLE", generate_tool_button_style(
+    text_color="$error", hover_bg="$hover_red", hover_radius="2px"))
 
 # Стиль для холста скрипта
-SCRIPT_CANVAS_STYLE = generate_container_style("#252525", COLOR_BORDER_LIGHT, "3px")
-
-# Стиль для кнопки отмены (красная)
-CANCEL_BUTTON_STYLE = generate_button_style(COLOR_ERROR, COLOR_TEXT, "#FF6666", "3px", "5px 10px")
-
-# Стиль для кнопки подтверждения (зеленая)
-CONFIRM_BUTTON_STYLE = generate_button_style(COLOR_SUCCESS, COLOR_TEXT, "#66CC66", "3px", "5px 10px")
-
-# Стиль для панели кнопок
-BUTTONS_PANEL_STYLE = generate_container_style(COLOR_BG_DARK_2, COLOR_BORDER_LIGHT, "4px", "5px", "10px 0 0 0")
+SCRIPT_CANVAS_STYLE = _style("SCRIPT_CANVAS_STYLE", generate_container_style("$bg_canvas", "$border_light", "3px"))
 
 # Стиль для компактной секции настроек изображений
-COMPACT_IMAGE_SETTINGS_STYLE = f"""
-    QGroupBox {{
-        {FONT_WEIGHT_BOLD}
-        color: {COLOR_PRIMARY};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        border-radius: 4px;
-        margin-top: 8px;
-        padding-top: 16px;
-    }}
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        left: 6px;
-        padding: 0 3px;
-        color: {COLOR_PRIMARY};
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
+COMPACT_IMAGE_SETTINGS_STYLE = _style("COMPACT_IMAGE_SETTINGS_STYLE", """
+    QGroupBox {
+        $group_box
+        /* Цвет заголовка */
+        color: $primary;
+    }
+    QLabel {
+        color: $text;
         margin: 2px;
-    }}
-    QHBoxLayout {{
+    }
+    QHBoxLayout {
         margin: 2px;
         spacing: 4px;
-    }}
-"""
+    }
+""", group_box=generate_group_box_style("$primary", "$border_light", padding_top="16px"))
 
 # ======== СТИЛИ ДЛЯ СИНЕЙ ТЕМЫ ========
 
-# Базовый синий стиль
-BASE_BLUE_STYLE = generate_container_style(COLOR_BLUE_BG, COLOR_BLUE_ACCENT, extra_css=f"color: {COLOR_TEXT};")
-
 # Базовая синяя кнопка
-BASE_BLUE_BUTTON = generate_button_style(COLOR_BLUE_ACCENT, COLOR_TEXT, COLOR_BLUE_HIGHLIGHT, "4px", "8px 16px")
+_BLUE_BUTTON_TEMPLATE = generate_button_style("$blue_accent", "$text", "$blue_highlight", "4px", "8px 16px")
 
 # Стиль для диалогов скрипт-блоков с синей темой
-SCRIPT_DIALOG_BLUE_STYLE = f"""
-    QDialog {{
-        background-color: {COLOR_BLUE_BG};
-        border: 2px solid {COLOR_BLUE_ACCENT};
-    }}
-    QPushButton {{
-        {BASE_BLUE_BUTTON}
-    }}
-    QPushButton:hover {{
-        background-color: {COLOR_BLUE_HIGHLIGHT};
-    }}
-    QGroupBox {{
-        border: 1px solid {COLOR_BLUE_ACCENT};
-        color: {COLOR_BLUE_TEXT};
-        {FONT_WEIGHT_BOLD}
+SCRIPT_DIALOG_BLUE_STYLE = _style("SCRIPT_DIALOG_BLUE_STYLE", """
+    QDialog {
+        background-color: $blue_bg;
+        border: 2px solid $blue_accent;
+    }
+    $base_blue_button
+    QGroupBox {
+        border: 1px solid $blue_accent;
+        color: $blue_text;
+        $bold
         margin-top: 15px;
         padding-top: 15px;
-    }}
-    QGroupBox::title {{
+    }
+    QGroupBox::title {
         subcontrol-origin: margin;
         left: 10px;
         padding: 0 5px;
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
-    }}
-    QLineEdit, QComboBox {{
-        background-color: {COLOR_BLUE_BG_LIGHT};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BLUE_ACCENT};
+    }
+    QLabel {
+        color: $text;
+    }
+    QLineEdit, QComboBox {
+        background-color: $blue_bg_light;
+        color: $text;
+        border: 1px solid $blue_accent;
         border-radius: 3px;
         padding: 4px;
-    }}
-    QComboBox QAbstractItemView {{
-        background-color: {COLOR_BLUE_BG_LIGHT};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BLUE_ACCENT};
-    }}
-    QToolTip {{
-        background-color: {COLOR_BLUE_BG_LIGHT};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BLUE_ACCENT};
+    }
+    QComboBox QAbstractItemView {
+        background-color: $blue_bg_light;
+        color: $text;
+        border: 1px solid $blue_accent;
+    }
+    QToolTip {
+        background-color: $blue_bg_light;
+        color: $text;
+        border: 1px solid $blue_accent;
         padding: 2px;
-    }}
-    QScrollArea {{
+    }
+    QScrollArea {
         border: none;
         background-color: transparent;
-    }}
-    QScrollBar:vertical {{
-        background-color: {COLOR_BLUE_BG};
+    }
+    QScrollBar:vertical {
+        background-color: $blue_bg;
         width: 12px;
         margin: 0px;
-    }}
-    QScrollBar::handle:vertical {{
-        background-color: {COLOR_BLUE_ACCENT};
+    }
+    QScrollBar::handle:vertical {
+        background-color: $blue_accent;
         min-height: 20px;
         border-radius: 6px;
-    }}
-    QScrollBar::handle:vertical:hover {{
-        background-color: {COLOR_BLUE_HIGHLIGHT};
-    }}
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: $blue_highlight;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
         height: 0px;
-    }}
-"""
+    }
+""", base_blue_button=_BLUE_BUTTON_TEMPLATE)
 
 # Стиль для холста подмодуля в синей теме
-SCRIPT_SUBMODULE_CANVAS_STYLE = f"""
-    background-color: {COLOR_BLUE_BG_LIGHT};
+SCRIPT_SUBMODULE_CANVAS_STYLE = _style("SCRIPT_SUBMODULE_CANVAS_STYLE", """
+    background-color: $blue_bg_light;
     border-radius: 4px;
-    border: 1px solid {COLOR_BLUE_ACCENT};
+    border: 1px solid $blue_accent;
     padding: 0;
     margin: 0;
-"""
+""")
 
 # Стиль для элемента в холсте подмодуля
-SCRIPT_SUBMODULE_ITEM_STYLE = f"""
-    QFrame {{
+SCRIPT_SUBMODULE_ITEM_STYLE = _style("SCRIPT_SUBMODULE_ITEM_STYLE", """
+    QFrame {
         background-color: #354967;
-        border: 1px solid {COLOR_BLUE_ACCENT};
+        border: 1px solid $blue_accent;
         border-radius: 3px;
         margin: 2px;
-    }}
-    QFrame:hover {{
-        border: 1px solid {COLOR_BLUE_TEXT};
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
+    }
+    QFrame:hover {
+        border: 1px solid $blue_text;
+    }
+    QLabel {
+        color: $text;
         padding: 2px;
-    }}
-    QToolButton {{
+    }
+    QToolButton {
         background-color: transparent;
         border: none;
-        color: {COLOR_TEXT};
+        color: $text;
         icon-size: 16px;
         padding: 1px;
-    }}
-    QToolButton:hover {{
-        background-color: rgba(76, 123, 217, 0.3);
+    }
+    QToolButton:hover {
+        background-color: $hover_blue;
         border-radius: 2px;
-    }}
-"""
+    }
+""")
 
 # Стиль для кнопок в холсте подмодуля
-SCRIPT_SUBMODULE_BUTTON_STYLE = f"""
-    QPushButton {{
-        background-color: {COLOR_BLUE_ACCENT};
-        color: {COLOR_TEXT};
+SCRIPT_SUBMODULE_BUTTON_STYLE = _style("SCRIPT_SUBMODULE_BUTTON_STYLE", """
+    QPushButton {
+        background-color: $blue_accent;
+        color: $text;
         border-radius: 3px;
         padding: 5px 10px;
         font-weight: bold;
-    }}
-    QPushButton:hover {{
-        background-color: {COLOR_BLUE_HIGHLIGHT};
-    }}
-"""
+    }
+    QPushButton:hover {
+        background-color: $blue_highlight;
+    }
+""")
 
-CANVAS_MODULE_STYLE = generate_container_style(COLOR_BG_DARK_1, COLOR_BORDER, "5px")
+CANVAS_MODULE_STYLE = _style("CANVAS_MODULE_STYLE", generate_container_style("$bg_dark_1", "$border", "5px"))
 
-SETTINGS_CHECKBOX_STYLE = f"""
-    QCheckBox {{
-        color: {COLOR_TEXT};
+SETTINGS_CHECKBOX_STYLE = _style("SETTINGS_CHECKBOX_STYLE", """
+    QCheckBox {
+        color: $text;
         spacing: 5px;
-    }}
-    QCheckBox::indicator {{
+    }
+    QCheckBox::indicator {
         width: 16px;
         height: 16px;
         border: 1px solid #888;
         border-radius: 3px;
-        background-color: {COLOR_BG_DARK_3};
-    }}
-    QCheckBox::indicator:unchecked {{
-        background-color: {COLOR_BG_DARK_3};
-        border: 1px solid {COLOR_PRIMARY};
-    }}
-"""
+        background-color: $bg_dark_3;
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: $bg_dark_3;
+        border: 1px solid $primary;
+    }
+""")
 
-SCHEDULE_CONTAINER_STYLE = generate_container_style(COLOR_BG_DARK_3, border_radius="4px", padding="4px",
-                                                 extra_css=f"#scheduleContainer {{ }} QLabel {{ color: {COLOR_TEXT}; }}")
+SCHEDULE_CONTAINER_STYLE = _style("SCHEDULE_CONTAINER_STYLE", generate_container_style(
+    "$bg_dark_3", border_radius="4px", padding="4px", extra_css="#scheduleContainer { } QLabel { color: $text; }"))
 
-DATETIME_EDIT_STYLE = f"""
-    QDateTimeEdit {{
-        background-color: {COLOR_BG_DARK_3};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        border-radius: 3px;
-        padding: 4px;
-    }}
-    /* Стиль для календаря и связанных элементов */
-    QCalendarWidget {{
-        background-color: #2D2D30;
-        color: {COLOR_TEXT};
-    }}
-    QCalendarWidget QToolButton {{
-        color: {COLOR_TEXT};
-        background-color: #3A3A3D;
-        border: 1px solid #505054;
+# Правила выпадающего календаря, общие для поля даты и очереди менеджера
+_CALENDAR_TEMPLATE = """
+    QCalendarWidget {
+        background-color: $slate_bg;
+        color: $text;
+    }
+    QCalendarWidget QToolButton {
+        color: $text;
+        background-color: $slate_bg_light;
+        border: 1px solid $slate_border_light;
         border-radius: 3px;
-    }}
-    QCalendarWidget QMenu {{
-        color: {COLOR_TEXT};
-        background-color: #2D2D30;
-    }}
-    QCalendarWidget QSpinBox {{
-        color: {COLOR_TEXT};
-        background-color: #3A3A3D;
-        selection-background-color: #3A6EA5;
-        selection-color: {COLOR_TEXT};
-    }}
-    QCalendarWidget QTableView {{
-        alternate-background-color: #3E3E42;
-    }}
-    QCalendarWidget QAbstractItemView:enabled {{
-        color: {COLOR_TEXT};
-        background-color: #2D2D30;
-        selection-background-color: #3A6EA5;
-        selection-color: {COLOR_TEXT};
-    }}
-    QCalendarWidget QAbstractItemView:disabled {{
-        color: #777777;
-    }}
-    QCalendarWidget QWidget {{ 
-        background-color: #2D2D30;
-        color: {COLOR_TEXT};
-    }}
+    }
+    QCalendarWidget QMenu {
+        color: $text;
+        background-color: $slate_bg;
+    }
+    QCalendarWidget QSpinBox {
+        color: $text;
+        background-color: $slate_bg_light;
+        selection-background-color: $slate_selection;
+        selection-color: $text;
+    }
+    QCalendarWidget QTableView {
+        alternate-background-color: $slate_border;
+    }
+    QCalendarWidget QAbstractItemView:enabled {
+        color: $text;
+        background-color: $slate_bg;
+        selection-background-color: $slate_selection;
+        selection-color: $text;
+    }
+    QCalendarWidget QAbstractItemView:disabled {
+        color: $slate_text_disabled;
+    }
 """
 
-MANAGER_QUEUE_WIDGET_STYLE = f"""
-    QTreeView {{
-        background-color: #2D2D30;
-        color: {COLOR_TEXT};
+# Стиль для поля даты/времени и выпадающего календаря
+DATETIME_EDIT_STYLE = _style("DATETIME_EDIT_STYLE", """
+    QDateTimeEdit {
+        background-color: $bg_dark_3;
+        color: $text;
+        border: 1px solid $border_light;
+        border-radius: 3px;
+        padding: 4px;
+    }
+""" + _CALENDAR_TEMPLATE + """
+    /* Правило для вложенных виджетов остается последним: оно перекрывает фон кнопок календаря */
+    QCalendarWidget QWidget {
+        background-color: $slate_bg;
+        color: $text;
+    }
+""")
+
+# Стиль для дерева очереди менеджера, его меню и календаря
+MANAGER_QUEUE_WIDGET_STYLE = _style("MANAGER_QUEUE_WIDGET_STYLE", """
+    QTreeView {
+        background-color: $slate_bg;
+        color: $text;
         alternate-row-colors: true;
-        gridline-color: {COLOR_BORDER};
+        gridline-color: $border;
         border: none;
-    }}
-    QTreeView::item {{
+    }
+    QTreeView::item {
         padding: 6px 0;
-        border-bottom: 1px solid #3E3E42;
-    }}
+        border-bottom: 1px solid $slate_border;
+    }
     /* Стиль для родительских элементов (ботов) */
-    QTreeView::item:has-children {{
-        background-color: #3A3A3D;
+    QTreeView::item:has-children {
+        background-color: $slate_bg_light;
         font-weight: bold;
-        border-bottom: 1px solid #505054;
-    }}
+        border-bottom: 1px solid $slate_border_light;
+    }
     /* Стиль для дочерних элементов (эмуляторов) */
     QTreeView::branch:has-children:!has-siblings:closed,
-    QTreeView::branch:closed:has-children:has-siblings {{
+    QTreeView::branch:closed:has-children:has-siblings {
         border-image: none;
         image: url(assets/icons/expand-white.svg);
-    }}
+    }
     QTreeView::branch:open:has-children:!has-siblings,
-    QTreeView::branch:open:has-children:has-siblings {{
+    QTreeView::branch:open:has-children:has-siblings {
         border-image: none;
         image: url(assets/icons/collapse-white.svg);
-    }}
-    QTreeView::item:selected {{
-        background-color: #3A6EA5;
-        color: {COLOR_TEXT};
-    }}
-    QTreeView::item:hover {{
-        background-color: #2C5175;
-    }}
+    }
+    QTreeView::item:selected {
+        background-color: $slate_selection;
+        color: $text;
+    }
+    QTreeView::item:hover {
+        background-color: $slate_hover;
+    }
     /* Исправление стилей подсказок и контекстного меню */
-    QToolTip {{
-        background-color: #2D2D30;
-        color: {COLOR_TEXT};
-        border: 1px solid #3E3E42;
+    QToolTip {
+        background-color: $slate_bg;
+        color: $text;
+        border: 1px solid $slate_border;
         padding: 2px;
-    }}
-    QMenu {{
-        background-color: #2D2D30;
-        color: {COLOR_TEXT};
-        border: 1px solid #3E3E42;
-    }}
-    QMenu::item {{
+    }
+    QMenu {
+        background-color: $slate_bg;
+        color: $text;
+        border: 1px solid $slate_border;
+    }
+    QMenu::item {
         padding: 5px 18px 5px 30px;
-    }}
-    QMenu::item:selected {{
-        background-color: #3A6EA5;
-    }}
-    QMenu::separator {{
+    }
+    QMenu::item:selected {
+        background-color: $slate_selection;
+    }
+    QMenu::separator {
         height: 1px;
-        background-color: #3E3E42;
+        background-color: $slate_border;
         margin: 4px 0px;
-    }}
-    /* Стиль для календаря и связанных элементов */
-    QCalendarWidget {{
-        background-color: #2D2D30;
-        color: {COLOR_TEXT};
-    }}
-    QCalendarWidget QToolButton {{
-        color: {COLOR_TEXT};
-        background-color: #3A3A3D;
-        border: 1px solid #505054;
-        border-radius: 3px;
-    }}
-    QCalendarWidget QMenu {{
-        color: {COLOR_TEXT};
-        background-color: #2D2D30;
-    }}
-    QCalendarWidget QSpinBox {{
-        color: {COLOR_TEXT};
-        background-color: #3A3A3D;
-        selection-background-color: #3A6EA5;
-        selection-color: {COLOR_TEXT};
-    }}
-    QCalendarWidget QTableView {{
-        alternate-background-color: #3E3E42;
-    }}
-    QCalendarWidget QAbstractItemView:enabled {{
-        color: {COLOR_TEXT};
-        background-color: #2D2D30;
-        selection-background-color: #3A6EA5;
-        selection-color: {COLOR_TEXT};
-    }}
-    QCalendarWidget QAbstractItemView:disabled {{
-        color: #777777;
-    }}
-"""
+    }
+""" + _CALENDAR_TEMPLATE)
 
-BLUE_SPINNER_STYLE = generate_input_style(COLOR_BLUE_BG_LIGHT, COLOR_TEXT, COLOR_BLUE_ACCENT)
+BLUE_SPINNER_STYLE = _style("BLUE_SPINNER_STYLE", generate_input_style("$blue_bg_light", "$text", "$blue_accent"))
 
-BLUE_BUTTON_PANEL_STYLE = f"""
-    QFrame {{
-        border-top: 1px solid {COLOR_BLUE_ACCENT};
+BLUE_BUTTON_PANEL_STYLE = _style("BLUE_BUTTON_PANEL_STYLE", """
+    QFrame {
+        border-top: 1px solid $blue_accent;
         margin-top: 10px;
         padding-top: 10px;
-    }}
-"""
+    }
+""")
 
-IMAGE_SEARCH_DIALOG_STYLE = f"""
-    QDialog {{
+# Стиль для диалога модуля поиска изображений
+IMAGE_SEARCH_DIALOG_STYLE = _style("IMAGE_SEARCH_DIALOG_STYLE", """
+    QDialog {
         background-color: #202020;
-        color: {COLOR_TEXT};
-    }}
-    QLabel {{
-        color: {COLOR_TEXT};
-    }}
-    QGroupBox {{
-        font-weight: bold;
-        color: {COLOR_PRIMARY};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        border-radius: 4px;
-        margin-top: 8px;
-        padding-top: 8px;
-    }}
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        left: 6px;
-        padding: 0 3px;
-    }}
-    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-        background-color: {COLOR_BG_DARK_2};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        border-radius: 3px;
-        padding: 4px;
-        selection-background-color: {COLOR_PRIMARY};
-    }}
-    QComboBox {{
-        background-color: {COLOR_BG_DARK_2};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BORDER_LIGHT};
+        color: $text;
+    }
+    QLabel {
+        color: $text;
+    }
+    QGroupBox {
+        $group_box
+    }
+    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
+        background-color: $bg_dark_2;
+        color: $text;
+        border: 1px solid $border_light;
         border-radius: 3px;
         padding: 4px;
-        selection-background-color: {COLOR_PRIMARY};
-    }}
-    QComboBox QAbstractItemView {{
-        background-color: {COLOR_BG_DARK_2};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_BORDER_LIGHT};
-        selection-background-color: {COLOR_PRIMARY};
-    }}
-    QPushButton {{
-        background-color: {COLOR_PRIMARY};
+        selection-background-color: $primary;
+    }
+    QComboBox QAbstractItemView {
+        background-color: $bg_dark_2;
+        color: $text;
+        border: 1px solid $border_light;
+        selection-background-color: $primary;
+    }
+    QPushButton {
+        background-color: $primary;
         color: black;
         border-radius: 3px;
         padding: 4px 8px;
         font-weight: bold;
-    }}
-    QPushButton:hover {{
-        background-color: {COLOR_WARNING};
-    }}
-    QTableWidget {{
-        background-color: {COLOR_BG_DARK_2};
-        color: {COLOR_TEXT};
-        gridline-color: {COLOR_BORDER_LIGHT};
+    }
+    QPushButton:hover {
+        background-color: $warning;
+    }
+    QTableWidget {
+        background-color: $bg_dark_2;
+        color: $text;
+        gridline-color: $border_light;
         border: none;
-    }}
-    QHeaderView::section {{
-        background-color: #333;
-        color: {COLOR_PRIMARY};
+    }
+    QHeaderView::section {
+        background-color: $bg_dark_3;
+        color: $primary;
         padding: 4px;
-        border: 1px solid {COLOR_BORDER_LIGHT};
-    }}
-    QToolTip {{
-        background-color: {COLOR_BG_DARK_2};
-        color: {COLOR_TEXT};
-        border: 1px solid {COLOR_PRIMARY};
-        padding: 2px;
-        opacity: 200;
-    }}
+        border: 1px solid $border_light;
+    }
+    $dialog_tooltip
     /* Для ScrollArea */
-    QScrollArea {{
+    QScrollArea {
         border: none;
         background-color: transparent;
-    }}
-    QScrollBar:vertical {{
-        background-color: {COLOR_BG_DARK_2};
+    }
+    QScrollBar:vertical {
+        background-color: $bg_dark_2;
         width: 12px;
         margin: 0px;
         border-radius: 3px;
-    }}
-    QScrollBar::handle:vertical {{
-        background-color: #555;
+    }
+    QScrollBar::handle:vertical {
+        background-color: $border_light;
         min-height: 20px;
         border-radius: 3px;
-    }}
-    QScrollBar::handle:vertical:hover {{
-        background-color: {COLOR_PRIMARY};
-    }}
-    QScrollBar::sub-line:vertical, QScrollBar::add-line:vertical {{
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: $primary;
+    }
+    QScrollBar::sub-line:vertical, QScrollBar::add-line:vertical {
         height: 0px;
-    }}
-"""
-
-MAIN_WINDOW_STYLE = f"""
-    QMainWindow {{
-        background-color: {COLOR_BG_DARK};
-    }}
-"""
+    }
+""", group_box=generate_group_box_style("$primary", "$border_light"), dialog_tooltip=_DIALOG_TOOLTIP_TEMPLATE)
 
 # Дополнительные стили для manager_page.py
-MANAGER_TABLE_HEADER_STYLE = """
+MANAGER_TABLE_HEADER_STYLE = _style("MANAGER_TABLE_HEADER_STYLE", """
     QHeaderView::section {
-        background-color: #333333;
-        color: #FFA500;
+        background-color: $bg_dark_3;
+        color: $primary;
         font-weight: bold;
         font-size: 12px;
         padding: 4px;
     }
-"""
+""")
 
-MANAGER_QUEUE_STYLE = """
-    background-color: #2D2D30;
+MANAGER_QUEUE_STYLE = _style("MANAGER_QUEUE_STYLE", """
+    background-color: $slate_bg;
     alternate-row-colors: true;
-    gridline-color: #444444;
-"""
+    gridline-color: $border;
+""")
 
-MANAGER_NAV_PANEL_STYLE = """
-    background-color: #252525;
-    border-top: 1px solid #444;
+MANAGER_NAV_PANEL_STYLE = _style("MANAGER_NAV_PANEL_STYLE", """
+    background-color: $bg_canvas;
+    border-top: 1px solid $border;
     border-radius: 4px;
     margin-top: 5px;
-"""
+""")
 
 # Дополнительные стили для ModuleItem
-HEADER_LAYOUT_STYLE = """
+HEADER_LAYOUT_STYLE = _style("HEADER_LAYOUT_STYLE", """
     QHBoxLayout {
         margin: 0;
         padding: 0;
         spacing: 2px;
     }
-"""
+""")
 
-MODULE_FRAME_STYLE = """
+MODULE_FRAME_STYLE = _style("MODULE_FRAME_STYLE", """
     QFrame {
         background-color: #2C2C2C;
-        border: 1px solid #555;
+        border: 1px solid $border_light;
         border-radius: 3px;
         margin: 2px;
     }
     QFrame:hover {
-        border: 1px solid #FFA500;
+        border: 1px solid $primary;
     }
-"""
+""")
 
-MODULE_NUMBER_STYLE = "color: #FFA500; font-weight: bold; min-width: 20px;"
-MODULE_TYPE_STYLE = "font-weight: bold; color: #FFA500;"
-MODULE_DESC_STYLE = "font-size: 11px; color: #CCCCCC; margin-left: 4px;"
-BUTTON_CONTAINER_STYLE = "margin: 0; padding: 0; spacing: 2px;"
+MODULE_NUMBER_STYLE = _style("MODULE_NUMBER_STYLE", "color: $primary; $bold min-width: 20px;")
+MODULE_TYPE_STYLE = _style("MODULE_TYPE_STYLE", "color: $primary; $bold")
+MODULE_DESC_STYLE = _style("MODULE_DESC_STYLE", "font-size: 11px; color: $text_secondary; margin-left: 4px;")
+BUTTON_CONTAINER_STYLE = _style("BUTTON_CONTAINER_STYLE", "margin: 0; padding: 0; spacing: 2px;")
 
 # Стили для BotSettingsDialog
-SETTINGS_FORM_STYLE = """
+SETTINGS_FORM_STYLE = _style("SETTINGS_FORM_STYLE", """
     QFormLayout {
         spacing: 8px;
     }
     QLabel {
-        color: white;
+        color: $text;
     }
-"""
+""")
 
-SETTINGS_GROUP_STYLE = """
+SETTINGS_GROUP_STYLE = _style("SETTINGS_GROUP_STYLE", """
     QGroupBox {
-        font-weight: bold;
-        color: #FFA500;
-        border: 1px solid #444;
-        border-radius: 4px;
-        margin-top: 12px;
-        padding-top: 14px;
-    }
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        left: 8px;
-        padding: 0 5px;
+        $group_box
     }
-"""
+""", group_box=generate_group_box_style("$primary", "$border", margin_top="12px", padding_top="14px",
+                                       title_offset="8px", title_padding="0 5px"))
 
-SETTINGS_SEPARATOR_STYLE = "background-color: #555;"
+SETTINGS_SEPARATOR_STYLE = _style("SETTINGS_SEPARATOR_STYLE", "background-color: $border_light;")
 
 # Стили для DialogModules
-DIALOG_TITLE_STYLE = "color: #FFA500; font-size: 16px; font-weight: bold;"
-BUTTON_PANEL_STYLE = """
+DIALOG_TITLE_STYLE = _alias("DIALOG_TITLE_STYLE", "TITLE_STYLE")
+BUTTON_PANEL_STYLE = _style("BUTTON_PANEL_STYLE", """
     QFrame {
-        border-top: 1px solid #444;
+        border-top: 1px solid $border;
         margin-top: 10px;
         padding-top: 10px;
     }
-"""
+""")
 
 
 # Стиль для заголовка модуля активности
-ACTIVITY_MODULE_TITLE_STYLE = f"color: {COLOR_PRIMARY}; font-size: 14px; {FONT_WEIGHT_BOLD} margin-bottom: 8px;"
+ACTIVITY_MODULE_TITLE_STYLE = _style("ACTIVITY_MODULE_TITLE_STYLE", "color: $primary; font-size: 14px; $bold margin-bottom: 8px;")
+
+# ======== ГЛОБАЛЬНЫЙ СТИЛЬ ПРИЛОЖЕНИЯ ========
+
+# Правила, которые адресуют виджеты по классу или objectName и не зависят от родителя.
+# Устанавливается один раз на QApplication вместо отдельных вызовов setStyleSheet.
+APPLICATION_STYLESHEET = _style("APPLICATION_STYLESHEET", """
+    /* Главное окно и страница создания бота */
+    QMainWindow, QWidget#createBotPage {
+        background-color: $bg_dark;
+    }
+    $tooltip
+""", tooltip=_TOOLTIP_RULE_TEMPLATE)
 
 # Обратная совместимость для старых имен
-MODULE_DIALOG_STYLE = BASE_DIALOG_STYLE
-TABLE_STYLE = BASE_TABLE_STYLE
-SETTINGS_BUTTON_STYLE = BASE_BUTTON_STYLE
\ No newline at end of file
+MODULE_DIALOG_STYLE = _alias("MODULE_DIALOG_STYLE", "BASE_DIALOG_STYLE")
+TABLE_STYLE = _alias("TABLE_STYLE", "BASE_TABLE_STYLE")
+SETTINGS_BUTTON_STYLE = _alias("SETTINGS_BUTTON_STYLE", "BASE_BUTTON_STYLE")
@@ -3,11 +3,14 @@
 Использует унифицированный подход с параметрами типа для уменьшения дублирования кода.
 """
 
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QPushButton, QLabel, QLineEdit, QSpinBox, QDoubleSpinBox,
     QGroupBox, QFrame, QTableWidget, QComboBox,
-    QToolButton, QFileDialog
+    QToolButton, QFileDialog, QVBoxLayout, QHBoxLayout
 )
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QFont
 
 
@@ -15,13 +18,92 @@ from src.utils.style_constants import (
     TITLE_STYLE, BASE_BUTTON_STYLE, DARK_BUTTON_STYLE,
     DELETE_BUTTON_STYLE, TOOL_BUTTON_STYLE,
     BASE_INPUT_STYLE, BASE_SPINBOX_STYLE, MAIN_FRAME_STYLE,
-    BASE_COMBOBOX_STYLE, BASE_TABLE_STYLE
+    BASE_COMBOBOX_STYLE, BASE_TABLE_STYLE, COMMAND_BUTTON_STYLE, SCRIPT_BUTTON_STYLE,
+    SCRIPT_ITEM_BUTTON_STYLE, SCRIPT_ITEM_DELETE_BUTTON_STYLE, SCRIPT_ITEM_STYLE,
+    SCRIPT_ITEM_HEADER_STYLE, SCRIPT_ITEM_DESCRIPTION_STYLE, combine_styles
 )
 from src.utils.resources import Resources
 
 
 # ======== УНИФИЦИРОВАННЫЕ ФУНКЦИИ СОЗДАНИЯ ВИДЖЕТОВ ========
 
+def apply_style(widget, *names):
+    """
+    Устанавливает виджету объединение именованных стилей одним вызовом setStyleSheet.
+    Каждая смена листа стилей заново применяет стили ко всем дочерним виджетам,
+    поэтому стиль из нескольких частей лучше собрать заранее, чем дописывать по частям.
+
+    Args:
+        widget: Виджет
+        *names: Имена стилей из style_constants (например, "PAGE_STYLE", "TOOLTIP_STYLE")
+
+    Returns:
+        Переданный виджет
+    """
+    sheet = combine_styles(*names)
+    # Повторная установка того же листа не меняет вид, но заставляет Qt заново разобрать его
+    if widget.styleSheet() != sheet:
+        widget.setStyleSheet(sheet)
+    return widget
+
+
+@lru_cache(maxsize=None)
+def _load_icon(icon_path):
+    """Загружает иконку из файла (один раз на каждый путь)."""
+    return QIcon(icon_path)
+
+
+def get_icon(icon):
+    """
+    Возвращает иконку по пути к файлу. Иконки кэшируются,
+    поэтому кнопки с одинаковой иконкой используют один объект QIcon.
+
+    Args:
+        icon: Путь к иконке или объект QIcon
+
+    Returns:
+        QIcon: Иконка
+    """
+    if isinstance(icon, str):
+        return _load_icon(icon)
+    return icon  # Если передан уже QIcon
+
+
+@lru_cache(maxsize=None)
+def _named_icon(icon_name):
+    """Возвращает иконку из каталога иконок по ее имени."""
+    return get_icon(Resources.get_icon_path(icon_name))
+
+
+def clear_icon_cache():
+    """Очищает кэш иконок (например, после замены файлов иконок)."""
+    _named_icon.cache_clear()
+    _load_icon.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _title_font(font_size):
+    """Создает шрифт заголовка заданного размера (setFont копирует его, поэтому объект общий)."""
+    return QFont("Segoe UI", font_size, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=256)
+def _label_style(color, font_size, bold):
+    """Собирает стиль метки из цвета, размера шрифта и жирности."""
+    style_parts = []
+
+    if color:
+        style_parts.append(f"color: {color};")
+
+    if font_size:
+        style_parts.append(f"font-size: {font_size}px;")
+
+    if bold:
+        style_parts.append("font-weight: bold;")
+
+    return " ".join(style_parts)
+
+
 def create_label(text, style=None, font_size=None, bold=False, color=None, is_title=False, align=None):
     """
     Универсальная функция для создания меток различных типов.
@@ -44,23 +126,12 @@ def create_label(text, style=None, font_size=None, bold=False, color=None, is_ti
         # Если это заголовок, используем стиль заголовка
         label.setStyleSheet(TITLE_STYLE)
         if font_size:
-            label.setFont(QFont("Segoe UI", font_size, QFont.Weight.Bold))
+            label.setFont(_title_font(font_size))
     elif style:
         label.setStyleSheet(style)
     elif font_size or bold or color:
-        # Создаем стиль на основе параметров
-        style_parts = []
-
-        if color:
-            style_parts.append(f"color: {color};")
-
-        if font_size:
-            style_parts.append(f"font-size: {font_size}px;")
-
-        if bold:
-            style_parts.append("font-weight: bold;")
-
-        label.setStyleSheet(" ".join(style_parts))
+        # Стиль на основе параметров собирается один раз для каждого сочетания
+        label.setStyleSheet(_label_style(color, font_size, bool(bold)))
 
     # Устанавливаем выравнивание, если указано
     if align:
@@ -69,8 +140,17 @@ def create_label(text, style=None, font_size=None, bold=False, color=None, is_ti
     return label
 
 
+# Стили кнопок по типу для create_button
+_BUTTON_STYLES = {
+    "default": BASE_BUTTON_STYLE,
+    "accent": BASE_BUTTON_STYLE,  # То же самое что и default
+    "dark": DARK_BUTTON_STYLE,
+    "delete": DELETE_BUTTON_STYLE
+}
+
+
 def create_button(text, style_type=None, style=None, icon_path=None,
-                  callback=None, tooltip=None):
+                  callback=None, tooltip=None, style_class=None):
     """
     Универсальная функция для создания кнопок различных типов.
 
@@ -81,30 +161,27 @@ def create_button(text, style_type=None, style=None, icon_path=None,
         icon_path: Путь к иконке или объект QIcon (опционально)
         callback: Функция обратного вызова (опционально)
         tooltip: Подсказка (опционально)
+        style_class: Вариант из листа стилей диалога ("accent", "dark", "delete"),
+            собственный стиль кнопке при этом не назначается (опционально)
 
     Returns:
         QPushButton: Созданная кнопка
     """
     button = QPushButton(text)
 
+    # Вариант оформления берется из BUTTON_VARIANTS_STYLE родительского диалога
+    if style_class:
+        button.setProperty("styleClass", style_class)
+
     # Выбираем стиль на основе типа
     if style:
         button.setStyleSheet(style)
     elif style_type:
-        styles = {
-            "default": BASE_BUTTON_STYLE,
-            "accent": BASE_BUTTON_STYLE,  # То же самое что и default
-            "dark": DARK_BUTTON_STYLE,
-            "delete": DELETE_BUTTON_STYLE
-        }
-        button.setStyleSheet(styles.get(style_type, BASE_BUTTON_STYLE))
+        button.setStyleSheet(_BUTTON_STYLES.get(style_type, BASE_BUTTON_STYLE))
 
     # Добавляем иконку, если указана
     if icon_path:
-        if isinstance(icon_path, str):
-            button.setIcon(QIcon(icon_path))
-        else:
-            button.setIcon(icon_path)  # Если передан уже QIcon
+        button.setIcon(get_icon(icon_path))
 
     # Подключаем обработчик события, если указан
     if callback:
@@ -143,10 +220,7 @@ def create_tool_button(text="", tooltip=None, callback=None, icon_path=None, sty
 
     # Добавляем иконку, если указана
     if icon_path:
-        if isinstance(icon_path, str):
-            button.setIcon(QIcon(icon_path))
-        else:
-            button.setIcon(icon_path)  # Если передан уже QIcon
+        button.setIcon(get_icon(icon_path))
 
     # Подключаем обработчик события, если указан
     if callback:
@@ -274,19 +348,20 @@ def create_combobox(items=None, default_index=0, style=None, editable=False):
     """
     combo = QComboBox()
 
-    # Устанавливаем стиль
-    combo.setStyleSheet(style or BASE_COMBOBOX_STYLE)
-
     # Добавляем элементы, если указаны
+    # addItems сам выбирает первый элемент, поэтому индекс меняем только для остальных
     if items:
         combo.addItems(items)
-        if 0 <= default_index < len(items):
+        if 0 < default_index < len(items):
             combo.setCurrentIndex(default_index)
 
     # Разрешаем редактирование, если указано
     if editable:
         combo.setEditable(True)
 
+    # Стиль устанавливаем последним, когда поле редактирования уже создано
+    combo.setStyleSheet(style or BASE_COMBOBOX_STYLE)
+
     return combo
 
 
@@ -310,7 +385,8 @@ def create_group_box(title, style=None):
     return group
 
 
-def create_table(columns=None, style=None, selectable=True, sortable=False, headers_visible=True):
+def create_table(columns=None, style=None, selectable=True, sortable=False, headers_visible=True,
+                 row_headers_visible=False):
     """
     Создает таблицу с заданными параметрами.
 
@@ -319,33 +395,36 @@ def create_table(columns=None, style=None, selectable=True, sortable=False, head
         style: CSS-стиль (опционально)
         selectable: Разрешить выделение (опционально)
         sortable: Разрешить сортировку (опционально)
-        headers_visible: Показывать заголовки (опционально)
+        headers_visible: Показывать заголовки столбцов (опционально)
+        row_headers_visible: Показывать заголовки строк (опционально)
 
     Returns:
         QTableWidget: Созданная таблица
     """
-    if columns is None:
-        columns = []
-
     # Создаем таблицу с указанным количеством столбцов
-    table = QTableWidget(0, len(columns))
+    count = len(columns) if columns else 0
+    table = QTableWidget(0, count)
 
     # Устанавливаем заголовки столбцов, если указаны
-    if columns:
+    if count:
         table.setHorizontalHeaderLabels(columns)
 
-    # Устанавливаем стиль
-    table.setStyleSheet(style or BASE_TABLE_STYLE)
-
-    # Скрываем заголовки строк
-    table.verticalHeader().setVisible(headers_visible)
+    # Заголовки видимы по умолчанию, поэтому вызываем setVisible только для скрытия
+    if not headers_visible:
+        table.horizontalHeader().setVisible(False)
+    if not row_headers_visible:
+        table.verticalHeader().setVisible(False)
 
     # Настраиваем выделение
     if not selectable:
         table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
 
-    # Настраиваем сортировку
-    table.setSortingEnabled(sortable)
+    # Сортировка выключена по умолчанию
+    if sortable:
+        table.setSortingEnabled(True)
+
+    # Стиль устанавливаем последним, после настройки заголовков
+    table.setStyleSheet(style or BASE_TABLE_STYLE)
 
     return table
 
@@ -397,44 +476,18 @@ def create_command_button(text, tooltip, icon_path=None, callback=None):
     """
     Создает кнопку команды для панелей инструментов.
     """
-    custom_style = """
-        QPushButton {
-            background-color: #333;
-            color: white;
-            border-radius: 3px;
-            padding: 3px 6px;
-            font-size: 11px;
-        }
-        QPushButton:hover {
-            background-color: #444;
-            border: 1px solid #FFA500;
-        }
-    """
-    return create_button(text, style=custom_style, icon_path=icon_path, callback=callback, tooltip=tooltip)
+    return create_button(text, style=COMMAND_BUTTON_STYLE, icon_path=icon_path, callback=callback, tooltip=tooltip)
 
 
 def create_script_button(text, tooltip=None, icon_path=None, callback=None):
     """
     Создает кнопку для панели инструментов в скрипте.
     """
-    custom_style = """
-        QPushButton {
-            background-color: #FFA500;
-            color: black;
-            border-radius: 3px;
-            padding: 5px 10px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #FFB347;
-        }
-    """
-
-    # Получаем полный путь к иконке, если указан
+    # Получаем иконку по имени из каталога иконок, если указана
     if icon_path:
-        icon_path = Resources.get_icon_path(icon_path)
+        icon_path = _named_icon(icon_path)
 
-    return create_button(text, style=custom_style, icon_path=icon_path, callback=callback, tooltip=tooltip)
+    return create_button(text, style=SCRIPT_BUTTON_STYLE, icon_path=icon_path, callback=callback, tooltip=tooltip)
 
 
 def create_multiple_file_dialog(title="Выбрать файлы", filter="Изображения (*.png *.jpg *.jpeg)"):
@@ -445,6 +498,29 @@ def create_multiple_file_dialog(title="Выбрать файлы", filter="Из
     return files
 
 
+def open_multiple_file_dialog(parent, on_accept, title="Выбрать файлы",
+                              filter="Изображения (*.png *.jpg *.jpeg)"):
+    """
+    Открывает диалог выбора нескольких файлов без блокирующего вызова.
+    Управление сразу возвращается вызывающему коду, выбранные файлы передаются в on_accept.
+
+    Args:
+        parent: Родительский виджет (владеет диалогом, пока тот открыт)
+        on_accept: Функция, принимающая список выбранных файлов
+        title: Заголовок диалога
+        filter: Фильтр файлов
+
+    Returns:
+        QFileDialog: Открытый диалог
+    """
+    dialog = QFileDialog(parent, title, "", filter)
+    dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+    dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    dialog.filesSelected.connect(on_accept)
+    dialog.open()
+    return dialog
+
+
 def position_dialog_with_offset(dialog, parent, x_offset=50, y_offset=50):
     """
     Позиционирует диалог со смещением относительно родительского окна.
@@ -460,12 +536,6 @@ def create_script_item_widget(index, item_type, description, data, parent=None):
     """
     Создает виджет элемента скрипта для использования в холсте скрипта.
     """
-    from PyQt6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel
-    from src.utils.style_constants import (
-        SCRIPT_ITEM_STYLE, SCRIPT_ITEM_HEADER_STYLE,
-        SCRIPT_ITEM_DESCRIPTION_STYLE
-    )
-
     # Основной фрейм элемента
     item_frame = QFrame(parent)
     item_frame.setObjectName(f"script_item_{index}")
@@ -499,8 +569,9 @@ def create_script_item_widget(index, item_type, description, data, parent=None):
 
     header_layout.addStretch(1)  # Растягиваем между типом и кнопками
 
-    # Сохраняем ссылку на метки для будущего обновления
+    # Сохраняем ссылки на метку и строку заголовка для будущего обновления
     item_frame.index_label = index_label
+    item_frame.header_layout = header_layout
 
     # Кнопки вернём отдельно, чтобы не усложнять интерфейс функции
     main_layout.addLayout(header_layout)
@@ -517,6 +588,15 @@ def create_script_item_widget(index, item_type, description, data, parent=None):
     return item_frame
 
 
+# Кнопки управления элементом скрипта: (текст, подсказка, стиль) в порядке добавления в заголовок
+_SCRIPT_ITEM_BUTTONS = (
+    ("↑", "Переместить вверх", SCRIPT_ITEM_BUTTON_STYLE),
+    ("↓", "Переместить вниз", SCRIPT_ITEM_BUTTON_STYLE),
+    ("🖉", "Редактировать", SCRIPT_ITEM_BUTTON_STYLE),
+    ("✕", "Удалить", SCRIPT_ITEM_DELETE_BUTTON_STYLE),
+)
+
+
 def add_script_item_buttons(item_frame, edit_callback=None, delete_callback=None,
                             move_up_callback=None, move_down_callback=None):
     """
@@ -525,45 +605,16 @@ def add_script_item_buttons(item_frame, edit_callback=None, delete_callback=None
     Returns:
         tuple: Кортеж из созданных кнопок (edit_btn, delete_btn, move_up_btn, move_down_btn)
     """
-    from PyQt6.QtWidgets import QToolButton
-    from src.utils.style_constants import SCRIPT_ITEM_BUTTON_STYLE, SCRIPT_ITEM_DELETE_BUTTON_STYLE
-
-    # Получаем header_layout из первого элемента основного лейаута
-    header_layout = item_frame.layout().itemAt(0).layout()
-
-    # Кнопки управления
-    move_up_btn = QToolButton()
-    move_up_btn.setText("↑")
-    move_up_btn.setToolTip("Переместить вверх")
-    move_up_btn.setStyleSheet(SCRIPT_ITEM_BUTTON_STYLE)
-    if move_up_callback:
-        move_up_btn.clicked.connect(move_up_callback)
-
-    move_down_btn = QToolButton()
-    move_down_btn.setText("↓")
-    move_down_btn.setToolTip("Переместить вниз")
-    move_down_btn.setStyleSheet(SCRIPT_ITEM_BUTTON_STYLE)
-    if move_down_callback:
-        move_down_btn.clicked.connect(move_down_callback)
-
-    edit_btn = QToolButton()
-    edit_btn.setText("🖉")
-    edit_btn.setToolTip("Редактировать")
-    edit_btn.setStyleSheet(SCRIPT_ITEM_BUTTON_STYLE)
-    if edit_callback:
-        edit_btn.clicked.connect(edit_callback)
-
-    delete_btn = QToolButton()
-    delete_btn.setText("✕")
-    delete_btn.setToolTip("Удалить")
-    delete_btn.setStyleSheet(SCRIPT_ITEM_DELETE_BUTTON_STYLE)
-    if delete_callback:
-        delete_btn.clicked.connect(delete_callback)
-
-    # Добавляем кнопки в лейаут
-    header_layout.addWidget(move_up_btn)
-    header_layout.addWidget(move_down_btn)
-    header_layout.addWidget(edit_btn)
-    header_layout.addWidget(delete_btn)
+    # Строка заголовка сохранена при создании элемента; для других фреймов берем первый элемент лейаута
+    header_layout = getattr(item_frame, "header_layout", None) or item_frame.layout().itemAt(0).layout()
+
+    # Кнопки управления в порядке _SCRIPT_ITEM_BUTTONS
+    callbacks = (move_up_callback, move_down_callback, edit_callback, delete_callback)
+    buttons = []
+    for (text, tooltip, style), callback in zip(_SCRIPT_ITEM_BUTTONS, callbacks):
+        button = create_tool_button(text, tooltip, callback, style=style)
+        header_layout.addWidget(button)
+        buttons.append(button)
 
+    move_up_btn, move_down_btn, edit_btn, delete_btn = buttons
     return edit_btn, delete_btn, move_up_btn, move_down_btn
\ No newline at end of file
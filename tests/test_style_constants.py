@@ -0,0 +1,128 @@
+"""
+Тесты модуля стилей: минификация, подстановка палитры и интернирование готовых стилей.
+"""
+
+import sys
+
+from src.utils.style_constants import (
+    DEFAULT_PALETTE, PALETTES, TITLE_STYLE, PAGE_STYLE, TOOLTIP_STYLE,
+    BASE_INPUT_STYLE, BASE_SPINBOX_STYLE, TABLE_STYLE, BASE_TABLE_STYLE,
+    _minify, get_style, get_styles, compile_qss, combine_styles, generate_button_style
+)
+
+
+# ======== МИНИФИКАЦИЯ ========
+
+def test_minify_strips_comments_and_whitespace():
+    qss = """
+        /* Комментарий */
+        QLabel {
+            color : #FFFFFF ;
+            padding: 2px;
+        }
+    """
+    assert _minify(qss) == "QLabel{color:#FFFFFF;padding:2px}"
+
+
+def test_minify_collapses_repeated_declarations():
+    assert _minify("QLabel { color: red; color: red; }") == "QLabel{color:red}"
+
+
+def test_minify_keeps_declaration_values_with_spaces():
+    assert _minify("border: 1px  solid  #444444;") == "border:1px solid #444444;"
+
+
+def test_minify_result_is_interned():
+    qss = _minify("QLabel { color: " + "".join(["#", "ABCDEF"]) + "; }")
+    assert qss is sys.intern("QLabel{color:#ABCDEF}")
+
+
+# ======== ПОДСТАНОВКА ПАЛИТРЫ ========
+
+def test_default_style_uses_default_palette():
+    assert DEFAULT_PALETTE["primary"] in TITLE_STYLE
+    assert "$" not in TITLE_STYLE
+
+
+def test_get_style_substitutes_custom_palette():
+    palette = dict(DEFAULT_PALETTE, primary="#123456")
+    style = get_style("TITLE_STYLE", palette)
+
+    assert "color:#123456" in style
+    assert DEFAULT_PALETTE["primary"] not in style
+
+
+def test_get_style_with_palette_name_matches_module_constant():
+    assert get_style("PAGE_STYLE") is PAGE_STYLE
+    assert get_style("PAGE_STYLE", "dark") is PAGE_STYLE
+    assert compile_qss("PAGE_STYLE", "dark") is PAGE_STYLE
+
+
+def test_custom_palette_reaches_embedded_fragments():
+    palette = dict(DEFAULT_PALETTE, bg_dark_2="#010203")
+    style = get_style("APPLICATION_STYLESHEET", palette)
+
+    # Подсказки встроены фрагментом и должны получить цвет той же палитры
+    assert "QToolTip{background-color:#010203" in style
+
+
+def test_get_styles_returns_public_styles_only():
+    styles = get_styles()
+
+    assert styles["TOOLTIP_STYLE"] is TOOLTIP_STYLE
+    assert "_TOOLTIP_TEMPLATE" not in styles
+    assert all(name.endswith("_STYLE") or name == "APPLICATION_STYLESHEET" for name in styles)
+
+
+def test_get_styles_is_cached_per_palette_name():
+    assert get_styles() is get_styles("dark")
+    assert get_styles(dict(DEFAULT_PALETTE)) is not get_styles(dict(DEFAULT_PALETTE))
+
+
+def test_palettes_contain_default():
+    assert PALETTES["dark"] is DEFAULT_PALETTE
+
+
+def _contrast_palette():
+    """Палитра, в которой каждое значение отличается от значений палитры по умолчанию."""
+    palette = {key: f"#{0xA10000 + i:06X}" for i, key in enumerate(DEFAULT_PALETTE)}
+    palette["bold"] = "font-weight: 600;"
+    return palette
+
+
+def test_non_default_palette_leaves_no_default_colors(monkeypatch):
+    monkeypatch.setitem(PALETTES, "contrast", _contrast_palette())
+    default_values = {value.replace(" ", "") for key, value in DEFAULT_PALETTE.items() if key != "bold"}
+
+    for name in get_styles():
+        style = compile_qss(name, "contrast").upper()
+        leftovers = [value for value in default_values if value.upper() in style]
+        assert not leftovers, f"{name}: {leftovers}"
+
+
+# ======== ИНТЕРНИРОВАНИЕ И ПОВТОРНОЕ ИСПОЛЬЗОВАНИЕ ========
+
+def test_aliases_share_one_string():
+    assert BASE_SPINBOX_STYLE is BASE_INPUT_STYLE
+    assert TABLE_STYLE is BASE_TABLE_STYLE
+
+
+def test_generators_return_same_object_for_same_arguments():
+    first = generate_button_style("#111111", "black")
+    second = generate_button_style("#111111", "black")
+
+    assert first is second
+
+
+def test_generate_button_style_can_omit_border():
+    assert "border:" not in generate_button_style("#111111", "black", border=None)
+    assert "border:none" in generate_button_style("#111111", "black")
+
+
+def test_combine_styles_joins_and_interns():
+    combined = combine_styles("PAGE_STYLE", "TOOLTIP_STYLE")
+
+    assert combined == PAGE_STYLE + " " + TOOLTIP_STYLE
+    assert combined is combine_styles("PAGE_STYLE", "TOOLTIP_STYLE")
+    assert combined is sys.intern(PAGE_STYLE + " " + TOOLTIP_STYLE)
+
@@ -0,0 +1,99 @@
+"""
+Тесты фабрики виджетов: таблицы, повторная установка стилей и кэш иконок.
+Виджетам нужен экземпляр QApplication, цикл событий не запускается.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from src.utils import ui_factory
+from src.utils.resources import Resources
+from src.utils.style_constants import BASE_TABLE_STYLE, combine_styles
+
+
+@pytest.fixture(scope="module", autouse=True)
+def app():
+    """Создает QApplication один раз на модуль."""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+class CountingWidget(QtWidgets.QWidget):
+    """Виджет, считающий вызовы setStyleSheet."""
+
+    def __init__(self):
+        super().__init__()
+        self.sheet_calls = 0
+
+    def setStyleSheet(self, sheet):
+        self.sheet_calls += 1
+        super().setStyleSheet(sheet)
+
+
+# ======== СТИЛИ ========
+
+def test_apply_style_sets_combined_sheet():
+    widget = CountingWidget()
+    ui_factory.apply_style(widget, "PAGE_STYLE", "TOOLTIP_STYLE")
+
+    assert widget.styleSheet() == combine_styles("PAGE_STYLE", "TOOLTIP_STYLE")
+    assert widget.sheet_calls == 1
+
+
+def test_apply_style_skips_identical_sheet():
+    widget = CountingWidget()
+    ui_factory.apply_style(widget, "PAGE_STYLE")
+    ui_factory.apply_style(widget, "PAGE_STYLE")
+
+    assert widget.sheet_calls == 1
+
+
+# ======== ТАБЛИЦЫ ========
+
+def test_create_table_hides_row_headers_by_default():
+    table = ui_factory.create_table(["A", "B"])
+
+    assert table.columnCount() == 2
+    assert table.horizontalHeaderItem(1).text() == "B"
+    assert table.verticalHeader().isHidden()
+    assert not table.horizontalHeader().isHidden()
+    assert table.styleSheet() == BASE_TABLE_STYLE
+
+
+def test_create_table_header_flags():
+    table = ui_factory.create_table(["A"], headers_visible=False, row_headers_visible=True)
+
+    assert table.horizontalHeader().isHidden()
+    assert not table.verticalHeader().isHidden()
+
+
+def test_create_table_without_columns():
+    table = ui_factory.create_table()
+
+    assert table.columnCount() == 0
+    assert not table.isSortingEnabled()
+
+
+# ======== ИКОНКИ ========
+
+def test_get_icon_returns_cached_icon_for_path():
+    path = Resources.get_icon_path("burger")
+
+    assert ui_factory.get_icon(path) is ui_factory.get_icon(path)
+
+
+def test_get_icon_passes_qicon_through():
+    icon = ui_factory.get_icon(Resources.get_icon_path("burger"))
+
+    assert ui_factory.get_icon(icon) is icon
+
+
+def test_clear_icon_cache_drops_cached_icons():
+    path = Resources.get_icon_path("burger")
+    icon = ui_factory.get_icon(path)
+    ui_factory.clear_icon_cache()
+
+    assert ui_factory.get_icon(path) is not icon